@@ -0,0 +1,160 @@
+"""
+Latency and output tokens per sample of the free-text vs. constrained
+answer modes, against a local fake OpenAI-compatible server.
+
+The fake server simulates generation cost as a fixed time-to-first-token
+plus a per-output-token delay; the free-text "model" writes its letter
+followed by a short rationale, the way chat models tend to answer when
+nothing caps the output. No API key or network access is needed.
+
+Run from the A2 directory:
+    python3 benchmarks/bench_answer_mode.py --n_samples 200
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from evaluator import evaluate_model
+from model_interface import BenchmarkModel, option_letters
+
+RATIONALE = ("Because the figure shows the stated values and the other options "
+             "contradict the question so this choice is the only consistent one").split()
+
+
+def fake_answer(question: str, letters: list[str]) -> tuple[str, dict]:
+    """Deterministic (answer, option probabilities) of the fake model for a question."""
+    rng = random.Random(question)
+    weights = [rng.random() ** 3 for _ in letters]
+    total = sum(weights)
+    probs = {letter: w / total for letter, w in zip(letters, weights)}
+    return max(probs, key=probs.get), probs
+
+
+def make_handler(base_latency: float, per_token: float, rationale_tokens: int):
+    class FakeChatCompletions(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            prompt = body["messages"][0]["content"][0]["text"]
+            letters = re.search(r"\[([A-Z|]+)\]", prompt).group(1).split("|")
+            question = re.search(r"Question: (.*)", prompt).group(1)
+            answer, probs = fake_answer(question, letters)
+
+            if body.get("max_tokens") == 1:
+                content, n_tokens = answer, 1
+            else:
+                words = RATIONALE * (rationale_tokens // len(RATIONALE) + 1)
+                content = f"{answer}. " + " ".join(words[:rationale_tokens])
+                n_tokens = rationale_tokens + 2
+            time.sleep(base_latency + per_token * n_tokens)
+
+            logprobs = None
+            if body.get("logprobs"):
+                # like real tokenizers, part of each letter's mass goes to variant tokens
+                tokens = {variant: p * share for letter, p in probs.items()
+                          for variant, share in ((letter, 0.8), (f" {letter}", 0.15),
+                                                 (letter.lower(), 0.05))}
+                ranked = sorted(tokens.items(), key=lambda kv: -kv[1])[:body.get("top_logprobs") or 0]
+                logprobs = {"content": [{
+                    "token": content[:1], "logprob": math.log(tokens[answer]), "bytes": None,
+                    "top_logprobs": [{"token": token, "logprob": math.log(p), "bytes": None}
+                                     for token, p in ranked],
+                }]}
+            payload = json.dumps({
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "length" if body.get("max_tokens") == 1 else "stop",
+                    "logprobs": logprobs,
+                }],
+                "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": n_tokens,
+                          "total_tokens": len(prompt.split()) + n_tokens},
+            }).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    return FakeChatCompletions
+
+
+def make_dataset(n: int, accuracy: float, seed: int = 0) -> list[dict]:
+    """MCQ samples with 2-9 options; the fake model's answer is right about `accuracy` of the time."""
+    rng = random.Random(seed)
+    dataset = []
+    for k in range(n):
+        options = [f"option {j}" for j in range(rng.randint(2, 9))]
+        question = f"Sample question {k}?"
+        letters = option_letters(options)
+        answer, _ = fake_answer(question, letters)
+        label = answer if rng.random() < accuracy else rng.choice(letters)
+        dataset.append({"question": question, "image": None, "options": options, "label": label})
+    return dataset
+
+
+def run_mode(base_url: str, dataset: list[dict], constrained: bool) -> tuple[dict, float]:
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        model = BenchmarkModel("fake-model", constrained=constrained, base_url=base_url)
+        start = time.perf_counter()
+        results = evaluate_model(model, dataset, max_samples=len(dataset))
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Free-text vs. constrained answer mode benchmark")
+    parser.add_argument("--n_samples", type=int, default=200)
+    parser.add_argument("--base_latency_ms", type=float, default=20.0,
+                        help="Simulated time to first token")
+    parser.add_argument("--per_token_ms", type=float, default=4.0,
+                        help="Simulated time per output token")
+    parser.add_argument("--rationale_tokens", type=int, default=40,
+                        help="Tokens the free-text answer adds after its letter")
+    parser.add_argument("--accuracy", type=float, default=0.7,
+                        help="How often the fake model's answer matches the label")
+    args = parser.parse_args()
+
+    # the client insists on a key; the fake server ignores it
+    os.environ.setdefault("OPENAI_API_KEY", "fake-key")
+    handler = make_handler(args.base_latency_ms / 1000, args.per_token_ms / 1000, args.rationale_tokens)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    dataset = make_dataset(args.n_samples, args.accuracy)
+
+    print(f"{args.n_samples} samples against {base_url} "
+          f"({args.base_latency_ms:.0f} ms + {args.per_token_ms:.0f} ms/token)")
+    print(f"{'mode':>12} | {'accuracy':>8} | {'ms/sample':>9} | {'tokens/sample':>13} | "
+          f"{'Brier':>6} | {'ECE':>6} | {'wall s':>7}")
+    try:
+        for constrained in (False, True):
+            results, wall = run_mode(base_url, dataset, constrained)
+            brier = f"{results['brier']:>6.3f}" if "brier" in results else f"{'-':>6}"
+            ece = f"{results['ece']:>6.3f}" if "ece" in results else f"{'-':>6}"
+            print(f"{'constrained' if constrained else 'free-text':>12} | {results['accuracy']:>8.3f} | "
+                  f"{results['mean_latency_s'] * 1000:>9.1f} | "
+                  f"{results['completion_tokens_per_sample']:>13.2f} | {brier} | {ece} | {wall:>7.2f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
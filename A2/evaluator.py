@@ -1,5 +1,5 @@
 from tqdm import tqdm
-from utils.metrics import compute_accuracy
+from utils.metrics import compute_accuracy, compute_brier_score, compute_ece
 
 
 def normalize_to_letter(pred: str) -> str:
@@ -17,6 +17,8 @@ def normalize_to_letter(pred: str) -> str:
 
 def evaluate_model(model, dataset, max_samples=50):
     y_true_letters, y_pred_letters = [], []
+    # per-sample option probabilities, latency and tokens, when the model reports them
+    records = []
 
     processed = 0
     pbar = tqdm(total=max_samples)
@@ -48,6 +50,16 @@ def evaluate_model(model, dataset, max_samples=50):
         y_true_letters.append(true_letter)
         y_pred_letters.append(pred_letter)
 
+        details = getattr(model, "last_response", None)
+        if isinstance(details, dict) and details:
+            records.append({
+                "true": true_letter,
+                "pred": pred_letter,
+                "option_probs": details.get("option_probs") or {},
+                "latency_s": details.get("latency_s"),
+                "completion_tokens": details.get("completion_tokens"),
+            })
+
         processed += 1
         pbar.update(1)
     pbar.close()
@@ -62,4 +74,31 @@ def evaluate_model(model, dataset, max_samples=50):
     acc = compute_accuracy(y_true_letters, y_pred_letters)
     print(f" Accuracy: {acc:.4f}")
     correct_str = f"{correct_count}/{len(y_pred_letters)}"
-    return {"accuracy": round(acc, 4), "correct_str": correct_str}
+    results = {"accuracy": round(acc, 4), "correct_str": correct_str}
+    if records:
+        results.update(summarize_records(records))
+        results["records"] = records
+    return results
+
+
+def summarize_records(records):
+    """Mean latency, completion tokens and calibration over the recorded samples."""
+    summary = {}
+    latencies = [r["latency_s"] for r in records if r["latency_s"] is not None]
+    tokens = [r["completion_tokens"] for r in records if r["completion_tokens"] is not None]
+    if latencies:
+        summary["mean_latency_s"] = round(sum(latencies) / len(latencies), 4)
+        print(f" Mean latency: {summary['mean_latency_s'] * 1000:.1f} ms/sample")
+    if tokens:
+        summary["completion_tokens_per_sample"] = round(sum(tokens) / len(tokens), 2)
+        print(f" Completion tokens: {summary['completion_tokens_per_sample']:.2f}/sample")
+
+    scored = [r for r in records if r["option_probs"] and r["true"]]
+    if scored:
+        y_true = [r["true"] for r in scored]
+        probs = [r["option_probs"] for r in scored]
+        summary["brier"] = round(compute_brier_score(y_true, probs), 4)
+        summary["ece"] = round(compute_ece(y_true, probs), 4)
+        print(f" Calibration over {len(scored)} samples: Brier {summary['brier']:.4f} | "
+              f"ECE {summary['ece']:.4f}")
+    return summary
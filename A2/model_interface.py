@@ -1,18 +1,59 @@
 from PIL import Image
 import base64
 import io
+import math
+import time
 from openai import OpenAI
 
+# the chat completions API returns at most 20 alternatives per token
+MAX_TOP_LOGPROBS = 20
+
+
+def option_letters(options: list[str]) -> list[str]:
+    return [chr(ord('A') + i) for i in range(len(options))]
+
+
+def option_probabilities(logprobs, letters: list[str]) -> dict:
+    """
+    Probability of each option letter from the first output token's
+    top_logprobs, renormalized over the valid letters. Variants of the
+    same letter (" B", "b") are summed; letters outside the returned
+    alternatives get 0. Returns {} when no valid letter was returned.
+    """
+    content = getattr(logprobs, "content", None) or []
+    if not content:
+        return {}
+    mass = dict.fromkeys(letters, 0.0)
+    for alt in content[0].top_logprobs or []:
+        token = str(alt.token).strip().upper()
+        if token in mass:
+            mass[token] += math.exp(alt.logprob)
+    total = sum(mass.values())
+    if total <= 0:
+        return {}
+    return {letter: p / total for letter, p in mass.items()}
+
 
 class BenchmarkModel:
     """
     Set OPENAI_API_KEY in the environment.
+
+    constrained: answer with a single output token and score the options by
+                 the argmax of its log-probabilities instead of parsing text.
+    base_url: OpenAI-compatible endpoint (e.g. a local server); defaults to
+              the client's own (OPENAI_BASE_URL or api.openai.com).
+
+    After each predict(), last_response holds the answer, the per-option
+    probabilities (constrained mode), the request latency and token usage.
     """
 
-    def __init__(self, model_name: str):
+    def __init__(self, model_name: str, constrained: bool = False, base_url: str = None):
         self.model_name = model_name or "gpt-4o-mini"
-        print(f"Using OpenAI model: {self.model_name}")
-        self.client = OpenAI()
+        self.constrained = constrained
+        mode = " (constrained answer mode)" if constrained else ""
+        print(f"Using OpenAI model: {self.model_name}{mode}")
+        self.client = OpenAI(base_url=base_url) if base_url else OpenAI()
+        self.last_response = {}
 
     def _pil_to_data_url(self, image: Image.Image) -> str:
         buf = io.BytesIO()
@@ -21,12 +62,13 @@ class BenchmarkModel:
         return f"data:image/jpeg;base64,{b64}"
 
     def predict(self, question: str, image: Image.Image, options: list[str]):
+        letters = option_letters(options)
         options_text = "".join(
-            [f"{chr(ord('A')+i)}. {opt}\n" for i, opt in enumerate(options)])
+            [f"{letter}. {opt}\n" for letter, opt in zip(letters, options)])
 
         prompt = (
             "You are answering a multiple-choice question.\n"
-            "Return EXACTLY ONE letter from [A|B|C|D|E|F]. No other text.\n\n"
+            f"Return EXACTLY ONE letter from [{'|'.join(letters)}]. No other text.\n\n"
             f"Question: {question}\n\nOptions:\n{options_text}\n"
             "Answer (one letter only):"
         )
@@ -34,6 +76,7 @@ class BenchmarkModel:
         img_url = self._pil_to_data_url(image) if isinstance(
             image, Image.Image) else None
 
+        self.last_response = {}
         try:
             messages = [
                 {
@@ -44,11 +87,35 @@ class BenchmarkModel:
                 }
             ]
 
-            resp = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-            )
+            request = {"model": self.model_name, "messages": messages}
+            if self.constrained:
+                # one output token; its top alternatives score every option
+                request.update(
+                    max_tokens=1,
+                    temperature=0,
+                    logprobs=True,
+                    # variants (" A", "a") take slots too, so leave room beyond one per letter
+                    top_logprobs=min(MAX_TOP_LOGPROBS, 2 * len(letters) + 2),
+                )
+
+            start = time.perf_counter()
+            resp = self.client.chat.completions.create(**request)
+            latency = time.perf_counter() - start
+
             result = resp.choices[0].message.content or ""
+            probs = {}
+            if self.constrained:
+                probs = option_probabilities(resp.choices[0].logprobs, letters)
+                if probs:
+                    result = max(probs, key=probs.get)
+
+            completion_tokens = getattr(getattr(resp, "usage", None), "completion_tokens", None)
+            self.last_response = {
+                "answer": result,
+                "option_probs": probs,
+                "latency_s": latency,
+                "completion_tokens": completion_tokens if isinstance(completion_tokens, int) else None,
+            }
             print(f"Detail - OpenAI response: {result}")
             return result
         except Exception as e:
@@ -1,4 +1,5 @@
 import argparse
+import json
 from data_loader import load_mmmu_dataset
 from model_interface import BenchmarkModel
 from evaluator import evaluate_model
@@ -12,19 +13,31 @@ def main():
                         help="Number of samples to evaluate")
     parser.add_argument("--subject", type=str, default="Accounting",
                         help="MMMU subject split (e.g., Accounting, Computer_Science)")
+    parser.add_argument("--constrained", action="store_true",
+                        help="Answer with one token and score options by their logprobs")
+    parser.add_argument("--base_url", type=str, default=None,
+                        help="OpenAI-compatible endpoint, e.g. http://127.0.0.1:8000/v1")
+    parser.add_argument("--probs_out", type=str, default=None,
+                        help="Write per-sample option probabilities to this JSON-lines file")
     args = parser.parse_args()
 
     # Load data
     dataset = load_mmmu_dataset(subject=args.subject)
 
     # Initialize model
-    model = BenchmarkModel(args.model)
+    model = BenchmarkModel(args.model, constrained=args.constrained, base_url=args.base_url)
 
     # Run evaluation
     results = evaluate_model(model, dataset, max_samples=args.max_samples)
     print(
         f"Final results for {args.model}: accuracy: {results['accuracy']} | {results['correct_str']}")
 
+    if args.probs_out:
+        with open(args.probs_out, "w", encoding="utf-8") as f:
+            for record in results.get("records", []):
+                f.write(json.dumps(record) + "\n")
+        print(f"Per-sample option probabilities written to {args.probs_out}")
+
 
 if __name__ == "__main__":
     main()
@@ -175,6 +175,33 @@ class TestEvaluateModel(unittest.TestCase):
         self.assertIsNone(call_args[1])
         self.assertEqual(call_args[2], ["3", "4", "5"])
 
+    @patch('evaluator.tqdm')
+    @patch('builtins.print')
+    def test_records_option_probabilities(self, mock_print, mock_tqdm):
+        """Models that report last_response get latency, tokens and calibration"""
+        mock_tqdm.return_value = MagicMock()
+        responses = iter([
+            {"answer": "B", "option_probs": {"A": 0.1, "B": 0.8, "C": 0.1},
+             "latency_s": 0.02, "completion_tokens": 1},
+            {"answer": "A", "option_probs": {"A": 0.6, "B": 0.3, "C": 0.1},
+             "latency_s": 0.04, "completion_tokens": 1},
+        ])
+
+        def predict(question, image, options):
+            self.mock_model.last_response = next(responses)
+            return self.mock_model.last_response["answer"]
+
+        self.mock_model.predict.side_effect = predict
+        result = evaluate_model(self.mock_model, self.sample_dataset, max_samples=2)
+
+        self.assertEqual(len(result["records"]), 2)
+        self.assertEqual(result["records"][1]["option_probs"]["B"], 0.3)
+        self.assertAlmostEqual(result["mean_latency_s"], 0.03)
+        self.assertEqual(result["completion_tokens_per_sample"], 1.0)
+        # (0.01 + 0.04 + 0.01) and (0.36 + 0.49 + 0.01) averaged
+        self.assertAlmostEqual(result["brier"], 0.46)
+        self.assertIn("ece", result)
+
     @patch('evaluator.tqdm')
     @patch('builtins.print')
     def test_return_structure(self, mock_print, mock_tqdm):
@@ -1,7 +1,9 @@
+import math
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from PIL import Image
-from model_interface import BenchmarkModel
+from model_interface import BenchmarkModel, option_probabilities
 
 
 class TestBenchmarkModel(unittest.TestCase):
@@ -44,6 +46,52 @@ class TestBenchmarkModel(unittest.TestCase):
         result = self.model.predict(self.question, self.test_image, self.options)
         self.assertEqual(result, "")  
 
+    @patch("model_interface.OpenAI")
+    def test_prompt_lists_only_the_real_option_letters(self, mock_openai_class):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value.choices = [
+            MagicMock(message=MagicMock(content="A"))]
+        mock_openai_class.return_value = mock_client
+
+        BenchmarkModel("test-model").predict(self.question, None, ["Yes", "No"])
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertIn("[A|B]", kwargs["messages"][0]["content"][0]["text"])
+        self.assertNotIn("max_tokens", kwargs)
+
+    @patch("model_interface.OpenAI")
+    def test_constrained_mode_scores_by_logprobs(self, mock_openai_class):
+        top = [SimpleNamespace(token=t, logprob=math.log(p))
+               for t, p in [("C", 0.5), (" A", 0.2), ("The", 0.1), ("a", 0.1), ("D", 0.1)]]
+        mock_response = MagicMock()
+        # the sampled token disagrees with the argmax over the options
+        mock_response.choices = [MagicMock(message=MagicMock(content="The"),
+                                           logprobs=SimpleNamespace(content=[SimpleNamespace(top_logprobs=top)]))]
+        mock_response.usage = SimpleNamespace(completion_tokens=1)
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        model = BenchmarkModel("test-model", constrained=True)
+        result = model.predict(self.question, self.test_image, self.options)
+
+        self.assertEqual(result, "C")
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs["max_tokens"], 1)
+        self.assertTrue(kwargs["logprobs"])
+        self.assertEqual(kwargs["top_logprobs"], 2 * len(self.options) + 2)
+        probs = model.last_response["option_probs"]
+        self.assertEqual(list(probs), ["A", "B", "C", "D"])
+        self.assertAlmostEqual(sum(probs.values()), 1.0)
+        self.assertAlmostEqual(probs["A"], 0.3 / 0.9)
+        self.assertEqual(probs["B"], 0.0)
+        self.assertEqual(model.last_response["completion_tokens"], 1)
+
+    def test_option_probabilities_without_letters(self):
+        logprobs = SimpleNamespace(content=[SimpleNamespace(
+            top_logprobs=[SimpleNamespace(token="The", logprob=-0.1)])])
+        self.assertEqual(option_probabilities(logprobs, ["A", "B"]), {})
+        self.assertEqual(option_probabilities(None, ["A", "B"]), {})
+
     def test_pil_to_data_url(self):
         data_url = self.model._pil_to_data_url(self.test_image)
         self.assertTrue(data_url.startswith("data:image/jpeg;base64,"))
@@ -27,7 +27,8 @@ class TestBenchmarkPipeline(unittest.TestCase):
             with patch.object(builtins, "print") as mock_print:
                 run_benchmark.main()
                 mock_load_dataset.assert_called_once_with(subject="Accounting")
-                mock_model_class.assert_called_once_with("gpt-4o-mini")
+                mock_model_class.assert_called_once_with(
+                    "gpt-4o-mini", constrained=False, base_url=None)
                 mock_evaluate.assert_called_once_with(
                     mock_model, mock_dataset, max_samples=5)
                 printed = " ".join(str(call.args[0])
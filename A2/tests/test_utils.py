@@ -6,7 +6,7 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.metrics import compute_accuracy
+from utils.metrics import compute_accuracy, compute_brier_score, compute_ece
 
 
 class TestComputeAccuracy(unittest.TestCase):
@@ -56,4 +56,24 @@ class TestComputeAccuracy(unittest.TestCase):
         result = compute_accuracy(y_true, y_pred)
         
         self.assertEqual(result, 0.5, "Should correctly compute accuracy for numeric labels")
-    
\ No newline at end of file
+
+
+class TestCalibration(unittest.TestCase):
+    """Test suite for the option-probability calibration metrics"""
+
+    def test_brier_perfect_and_uniform(self):
+        self.assertEqual(compute_brier_score(["A"], [{"A": 1.0, "B": 0.0}]), 0.0)
+        self.assertAlmostEqual(compute_brier_score(["A"], [{"A": 0.5, "B": 0.5}]), 0.5)
+
+    def test_brier_varying_option_counts(self):
+        probs = [{"A": 1.0, "B": 0.0}, {"A": 0.0, "B": 0.0, "C": 1.0}]
+        self.assertAlmostEqual(compute_brier_score(["A", "A"], probs), 1.0)
+
+    def test_ece(self):
+        # confident and right: no gap; 0.6 confident and wrong: gap 0.6
+        probs = [{"A": 1.0, "B": 0.0}, {"A": 0.6, "B": 0.4}]
+        self.assertAlmostEqual(compute_ece(["A", "B"], probs), 0.3)
+
+    def test_empty(self):
+        self.assertTrue(np.isnan(compute_brier_score([], [])))
+        self.assertTrue(np.isnan(compute_ece([], [])))
@@ -1,3 +1,4 @@
+import numpy as np
 from sklearn.metrics import accuracy_score
 
 def compute_accuracy(y_true, y_pred):
@@ -5,3 +6,42 @@ def compute_accuracy(y_true, y_pred):
     Compute accuracy between true labels and predicted answers.
     """
     return accuracy_score(y_true, y_pred)
+
+
+def _probability_matrix(y_true, option_probs):
+    """Rows of option probabilities and one-hot true answers over the same letters."""
+    probs, onehot = [], []
+    for true_letter, row in zip(y_true, option_probs):
+        letters = list(row)
+        probs.append(np.array([row[letter] for letter in letters], dtype=float))
+        onehot.append(np.array([letter == true_letter for letter in letters], dtype=float))
+    return probs, onehot
+
+
+def compute_brier_score(y_true, option_probs):
+    """
+    Multi-class Brier score: mean over samples of the squared error between
+    the per-option probabilities ({letter: p}) and the one-hot true answer.
+    """
+    probs, onehot = _probability_matrix(y_true, option_probs)
+    if not probs:
+        return float("nan")
+    return float(np.mean([np.sum((p - t) ** 2) for p, t in zip(probs, onehot)]))
+
+
+def compute_ece(y_true, option_probs, n_bins=10):
+    """
+    Expected calibration error of the argmax answer: the sample-weighted
+    gap between confidence and accuracy over n_bins confidence bins.
+    """
+    probs, onehot = _probability_matrix(y_true, option_probs)
+    if not probs:
+        return float("nan")
+    confidence = np.array([p.max() for p in probs])
+    correct = np.array([t[p.argmax()] for p, t in zip(probs, onehot)])
+    bins = np.minimum((confidence * n_bins).astype(int), n_bins - 1)
+    ece = 0.0
+    for b in np.unique(bins):
+        in_bin = bins == b
+        ece += in_bin.mean() * abs(confidence[in_bin].mean() - correct[in_bin].mean())
+    return float(ece)
@@ -0,0 +1,3 @@
+"""
+Smart factory alert agent: reusable pieces of the A3 notebook pipeline.
+"""
@@ -0,0 +1,105 @@
+import pandas as pd
+
+from .rules import MACHINE_COL, anomaly_score
+
+
+def build_combined_alerts(df_rule, df_ml):
+    """
+    Outer-join rule and ML alerts on timestamp, or on (machine_id, timestamp)
+    when the alerts carry a machine_id, so readings of different machines
+    at the same time stay separate rows.
+    """
+    df_rule = df_rule.copy()
+    df_ml = df_ml.copy()
+    by_machine = MACHINE_COL in df_rule or MACHINE_COL in df_ml
+    if by_machine:
+        for d in (df_rule, df_ml):
+            if MACHINE_COL not in d:
+                if len(d):
+                    raise ValueError(f"Only one of the alert frames has a '{MACHINE_COL}' column")
+                d[MACHINE_COL] = pd.Series(dtype=object)
+    keys = [MACHINE_COL, "timestamp"] if by_machine else ["timestamp"]
+    df_rule["timestamp"] = pd.to_datetime(df_rule["timestamp"])
+    df_ml["timestamp"] = pd.to_datetime(df_ml["timestamp"])
+
+    df_rule["rule_score"] = [
+        anomaly_score(t, p, v)
+        for t, p, v in zip(df_rule["temp"], df_rule["pressure"], df_rule["vibration"])
+    ]
+
+    rule_min = df_rule["rule_score"].min()
+    rule_max = df_rule["rule_score"].max()
+
+    # normalize rule score (a single distinct score normalizes to 0)
+    rule_range = (rule_max - rule_min) or 1.0
+    df_rule["rule_score"] = (df_rule["rule_score"] - rule_min) / rule_range
+
+    df_rule_alerts = df_rule.copy()
+    df_rule_alerts["rule"] = True
+    df_rule_alerts["ml"] = False
+
+    df_ml_alerts = df_ml.copy()
+    df_ml_alerts = df_ml_alerts.rename(columns={"anomaly_score": "ml_score"})
+    df_ml_alerts["rule"] = False
+    df_ml_alerts["ml"] = True
+
+    merged = pd.merge(
+        df_rule_alerts,
+        df_ml_alerts,
+        on=keys,
+        how="outer",
+        suffixes=("_rule", "_ml")
+    )
+
+    merged["rule"] = merged["rule_rule"].fillna(False).astype(bool)
+    merged["ml"] = merged["ml_ml"].fillna(False).astype(bool)
+
+    merged["temp"] = merged["temp_rule"].combine_first(merged["temp_ml"])
+    merged["pressure"] = merged["pressure_rule"].combine_first(
+        merged["pressure_ml"])
+    merged["vibration"] = merged["vibration_rule"].combine_first(
+        merged["vibration_ml"])
+
+    merged["alert_reasons"] = merged["alert_reasons"].fillna("")
+    merged["ml_explanation"] = merged["ml_explanation"].fillna("")
+    merged = merged[keys + [
+        "temp", "pressure", "vibration",
+        "rule", "ml", "rule_score", "ml_score",
+        "alert_reasons", "ml_explanation"
+    ]]
+
+    return merged.sort_values(keys[::-1]).reset_index(drop=True)
+
+
+def combined_alerts(merged_alerts):
+    print(f"\n===============================")
+    print(f"      ANOMALY ALERT AGENT")
+    print(f"===============================")
+    print(f"Total anomalies: {len(merged_alerts)}")
+    print(
+        f"Rule-based: {merged_alerts['rule'].sum()} | ML-based: {merged_alerts['ml'].sum()}\n")
+
+    for _, row in merged_alerts.iterrows():
+        if row["rule"] and row["ml"]:
+            source = "Both Rule-based and ML-based"
+        elif row["rule"]:
+            source = "Rule-based"
+        else:
+            source = "ML-based"
+
+        machine = f" {row[MACHINE_COL]}" if MACHINE_COL in row else ""
+        print(f"[{row['timestamp']}]{machine} ALERT ({source})")
+        print(
+            f"Temp={row['temp']:.2f}°C | Pressure={row['pressure']:.2f} | Vibration={row['vibration']:.3f}")
+
+        if pd.notna(row.get("rule_score")):
+            print(f"Rule Score: {row['rule_score']:.4f}")
+            if isinstance(row.get("alert_reasons"), str) and row["alert_reasons"]:
+                print(f"Reasons: {row['alert_reasons']}")
+
+        if pd.notna(row.get("ml_score")):
+            print(f"ML Anomaly Score: {row['ml_score']:.4f}")
+            print(
+                f"ML Suggestion: Abnormal {row['ml_explanation']}")
+
+        print("-" * 70)
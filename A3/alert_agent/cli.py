@@ -0,0 +1,77 @@
+import argparse
+
+from .alerts import combined_alerts
+from .data import generate_dummy_data, iter_frame_chunks, read_sensor_chunks
+from .episodes import print_episodes
+from .imputation import METHODS, SensorImputer
+from .notifier import FileSink, dispatch_episodes
+from .pipeline import run_pipeline
+from .rules import SENSORS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Smart Factory Alert Agent")
+    parser.add_argument("--input", type=str, default=None,
+                        help="CSV or Parquet file with timestamp, temp, pressure, vibration "
+                             "(and label for the training rows). Omit to use generated data.")
+    parser.add_argument("--chunksize", type=int, default=100_000,
+                        help="Rows read and processed per chunk")
+    parser.add_argument("--train_rows", type=int, default=50,
+                        help="Leading rows used to train the RandomForest")
+    parser.add_argument("--max_gap", type=str, default=None,
+                        help="Largest gap between alerts of one episode (e.g. 5min); "
+                             "defaults to the sampling interval")
+    parser.add_argument("--impute", choices=METHODS, default="ffill",
+                        help="How missing sensor readings are filled")
+    parser.add_argument("--impute_max_gap", type=int, default=3,
+                        help="Most consecutive missing readings filled per sensor (-1 = no limit); "
+                             "longer gaps raise a sensor-missing alert")
+    parser.add_argument("--n_rows", type=int, default=150,
+                        help="Rows of generated data when --input is omitted")
+    parser.add_argument("--alerts_out", type=str, default=None,
+                        help="Append alert episodes to this JSON-lines file")
+    parser.add_argument("--notify_batch_size", type=int, default=100,
+                        help="Episodes per notification batch")
+    parser.add_argument("--notify_rate", type=float, default=5.0,
+                        help="Maximum notification batches per second")
+    parser.add_argument("--show", choices=["episodes", "alerts", "none"], default="episodes",
+                        help="What to print after the run")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        chunks = read_sensor_chunks(args.input, chunksize=args.chunksize)
+    else:
+        df = generate_dummy_data(n_rows=args.n_rows, interval_minutes=5,
+                                 anomaly_rate=0.15, introduce_missing=True)
+        chunks = iter_frame_chunks(df, args.chunksize)
+
+    policy = {"method": args.impute,
+              "max_gap": None if args.impute_max_gap < 0 else args.impute_max_gap}
+    imputer = SensorImputer({s: policy for s in SENSORS})
+    result = run_pipeline(chunks, train_rows=args.train_rows, max_gap=args.max_gap, imputer=imputer)
+
+    if args.show == "alerts":
+        combined_alerts(result["merged_alerts"])
+    elif args.show == "episodes":
+        print_episodes(result["episodes"])
+    if args.show != "none":
+        for alert in result["missing_alerts"].itertuples():
+            print(f"[{alert.start} - {alert.end}] ALERT {alert.reason}: {alert.n_missing} readings")
+
+    if args.alerts_out:
+        sent = dispatch_episodes(result["episodes"], FileSink(args.alerts_out),
+                                 batch_size=args.notify_batch_size,
+                                 max_batches_per_sec=args.notify_rate)
+        print(f"Notifications sent: {sent} -> {args.alerts_out}")
+
+    print(
+        f"Processed {result['rows']} rows: rule alerts: {len(result['rule_anomalies'])} | "
+        f"ML alerts: {len(result['ml_anomalies'])} | episodes: {len(result['episodes'])} | "
+        f"sensor-missing alerts: {len(result['missing_alerts'])} | "
+        f"unscored rows: {result['unscored_rows']}")
+    result["timer"].print_report()
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import datetime
+import random
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def generate_dummy_data(
+    n_rows=300,
+    start_time="2025-01-07 1:00:00",
+    interval_minutes=1,
+    anomaly_rate=0.15,
+    introduce_missing=False,
+    missing_rate=0.01,
+):
+    """
+    Generates dataset obeying strict thresholds:
+      temp normal: 45-50 (inclusive) ; abnormal: >52 or <43
+      pressure normal: 1.00-1.05 (inclusive) ; abnormal: >1.08 or <0.97
+      vibration normal: 0.02-0.04 (inclusive) ; abnormal: >0.07
+    label is set to 'abnormal' if any sensor is abnormal, else 'normal'.
+    """
+    start = datetime.datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
+    timestamps = []
+    temps = []
+    pressures = []
+    vibrations = []
+    labels = []
+
+    for i in range(n_rows):
+        t = start + datetime.timedelta(minutes=interval_minutes * i)
+
+        # By default produce normal readings
+        temp = round(np.random.uniform(45.0, 50.0), 3)
+        pressure = round(np.random.uniform(1.00, 1.05), 3)
+        vibration = round(np.random.uniform(0.02, 0.04), 3)
+
+        # Inject anomalies by picking sensors to be abnormal
+        if random.random() < anomaly_rate:
+            num_abnormals = random.choice([1, 2])
+            sensors = random.sample(
+                ["temp", "pressure", "vibration"], num_abnormals)
+            for s in sensors:
+                if s == "temp":
+                    if random.random() < 0.5:
+                        temp = round(np.random.uniform(
+                            30.000, 42.999), 1)  # <43
+                    else:
+                        temp = round(np.random.uniform(
+                            52.001, 70.000), 1)  # >52
+                elif s == "pressure":
+                    if random.random() < 0.5:
+                        pressure = round(np.random.uniform(
+                            0.80, 0.969), 3)  # <0.97
+                    else:
+                        pressure = round(np.random.uniform(
+                            1.081, 1.30), 3)  # >1.08
+                else:  # vibration
+                    vibration = round(np.random.uniform(
+                        0.071, 0.300), 3)  # >0.07
+
+        # Decide label strictly from sensor thresholds
+        is_abnormal = (
+            (temp > 52.0 or temp < 43.0) or
+            (pressure > 1.08 or pressure < 0.97) or
+            (vibration > 0.07)
+        )
+        label = "abnormal" if is_abnormal else "normal"
+
+        timestamps.append(t)
+        temps.append(temp)
+        pressures.append(pressure)
+        vibrations.append(vibration)
+        labels.append(label)
+
+    df = pd.DataFrame({
+        "timestamp": timestamps,
+        "temp": temps,
+        "pressure": pressures,
+        "vibration": vibrations,
+        "label": labels
+    })
+
+    # some missing values to test preprocessing
+    if introduce_missing and missing_rate > 0:
+        n_cells = df.shape[0] * 3  # only sensor columns
+        n_missing = int(n_cells * missing_rate)
+        for _ in range(n_missing):
+            ridx = random.randrange(df.shape[0])
+            col = random.choice(["temp", "pressure", "vibration"])
+            df.at[ridx, col] = np.nan
+
+    return df
+
+
+def iter_frame_chunks(df: pd.DataFrame, chunksize: int):
+    """
+    Yield consecutive row slices of an in-memory frame, as copies so the
+    pipeline can impute them in place without touching df.
+    """
+    for start in range(0, len(df), chunksize):
+        yield df.iloc[start:start + chunksize].copy()
+
+
+def read_sensor_chunks(path, chunksize: int = 100_000):
+    """
+    Yield the sensor readings in `path` (.csv or .parquet) as DataFrames of
+    up to chunksize rows, with `timestamp` parsed as datetime.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            chunk["timestamp"] = pd.to_datetime(chunk["timestamp"])
+            yield chunk
+    elif suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Reading Parquet input requires pyarrow (pip install pyarrow)") from e
+        offset = 0
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            chunk["timestamp"] = pd.to_datetime(chunk["timestamp"])
+            yield chunk
+    else:
+        raise ValueError(f"Unsupported input format: {path.suffix} (expected .csv or .parquet)")
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+from .rules import SENSORS, SENSOR_REASONS, sensor_excess
+
+UNATTRIBUTED = "unattributed"
+
+EPISODE_COLUMNS = [
+    "machine_id", "sensor", "start", "end", "n_alerts",
+    "peak_rule_score", "peak_ml_score", "source", "reasons",
+]
+
+
+def _flag_sensors(alerts: pd.DataFrame, machine_col: str, default_machine: str) -> pd.DataFrame:
+    """
+    Turn one-row-per-alert into one-row-per-(alert, sensor) for every sensor
+    that the rules or the ML explanation blame.
+    """
+    n = len(alerts)
+    machine = (alerts[machine_col].to_numpy() if machine_col in alerts
+               else np.full(n, default_machine, dtype=object))
+    timestamps = pd.to_datetime(alerts["timestamp"]).to_numpy()
+
+    if "ml" in alerts:
+        ml_flag = alerts["ml"].fillna(False).to_numpy(dtype=bool)
+    else:
+        ml_flag = np.zeros(n, dtype=bool)
+    ml_score = (alerts["ml_score"].to_numpy(dtype=float) if "ml_score" in alerts
+                else np.full(n, np.nan))
+    explanation = (alerts["ml_explanation"].fillna("").astype(str) if "ml_explanation" in alerts
+                   else pd.Series([""] * n, index=alerts.index))
+
+    excess = {s: sensor_excess(alerts[s], s) for s in SENSORS}
+    explained = {s: explanation.str.contains(s, regex=False).to_numpy() for s in SENSORS}
+    # an "Unclear" ML alert is charged to whichever sensors broke the rules
+    unexplained = ml_flag & ~np.any(list(explained.values()), axis=0)
+
+    parts = []
+    for sensor in SENSORS:
+        values = alerts[sensor].to_numpy(dtype=float)
+        rule_hit = excess[sensor] > 0
+        ml_hit = ml_flag & (explained[sensor] | (unexplained & rule_hit))
+        hit = rule_hit | ml_hit
+        parts.append(pd.DataFrame({
+            "machine_id": machine[hit],
+            "sensor": sensor,
+            "timestamp": timestamps[hit],
+            "value": values[hit],
+            "rule_score": np.where(rule_hit, excess[sensor], np.nan)[hit],
+            "ml_score": np.where(ml_hit, ml_score, np.nan)[hit],
+            "rule_hit": rule_hit[hit],
+            "ml_hit": ml_hit[hit],
+        }))
+
+    # ML alerts that neither SHAP nor the rules tie to a sensor
+    orphan = unexplained & ~np.any([excess[s] > 0 for s in SENSORS], axis=0)
+    parts.append(pd.DataFrame({
+        "machine_id": machine[orphan],
+        "sensor": UNATTRIBUTED,
+        "timestamp": timestamps[orphan],
+        "value": np.nan,
+        "rule_score": np.nan,
+        "ml_score": ml_score[orphan],
+        "rule_hit": False,
+        "ml_hit": True,
+    }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def _episode_reasons(episode) -> str:
+    reasons = []
+    if episode.rule_hits:
+        label = SENSOR_REASONS.get(episode.sensor, episode.sensor)
+        reasons.append(
+            f"{label} x{episode.rule_hits} (min {episode.min_value:g}, max {episode.max_value:g})")
+    if episode.ml_hits:
+        reasons.append(f"ML flagged {episode.sensor} x{episode.ml_hits}")
+    return "; ".join(reasons)
+
+
+def build_alert_episodes(alerts: pd.DataFrame, max_gap, machine_col: str = "machine_id",
+                         default_machine: str = "machine-1") -> pd.DataFrame:
+    """
+    Merge consecutive anomalous readings into alert episodes per machine and sensor.
+
+    alerts: one row per anomalous reading (e.g. the output of build_combined_alerts).
+    max_gap: largest time between two alerts of the same machine/sensor that still
+             belong to the same episode, usually the sampling interval.
+    Returns one row per episode with start, end, peak scores and reasons.
+    """
+    if alerts is None or len(alerts) == 0:
+        return pd.DataFrame(columns=EPISODE_COLUMNS)
+
+    flagged = _flag_sensors(alerts, machine_col, default_machine)
+    if flagged.empty:
+        return pd.DataFrame(columns=EPISODE_COLUMNS)
+
+    flagged = flagged.sort_values(
+        ["machine_id", "sensor", "timestamp"], kind="stable").reset_index(drop=True)
+
+    same_stream = (
+        (flagged["machine_id"] == flagged["machine_id"].shift())
+        & (flagged["sensor"] == flagged["sensor"].shift())
+    )
+    gap = flagged["timestamp"].diff()
+    new_episode = ~(same_stream & (gap <= pd.Timedelta(max_gap)))
+    flagged["episode"] = new_episode.cumsum()
+    # the min/max in the rule reason cover only the readings that broke the rule
+    flagged["rule_value"] = flagged["value"].where(flagged["rule_hit"])
+
+    episodes = flagged.groupby("episode", sort=False).agg(
+        machine_id=("machine_id", "first"),
+        sensor=("sensor", "first"),
+        start=("timestamp", "min"),
+        end=("timestamp", "max"),
+        n_alerts=("timestamp", "size"),
+        peak_rule_score=("rule_score", "max"),
+        peak_ml_score=("ml_score", "max"),
+        rule_hits=("rule_hit", "sum"),
+        ml_hits=("ml_hit", "sum"),
+        min_value=("rule_value", "min"),
+        max_value=("rule_value", "max"),
+    )
+
+    # formatting happens per episode, not per reading
+    episodes["source"] = np.select(
+        [(episodes["rule_hits"] > 0) & (episodes["ml_hits"] > 0), episodes["rule_hits"] > 0],
+        ["Both", "Rule-based"],
+        default="ML-based",
+    )
+    episodes["reasons"] = [_episode_reasons(ep) for ep in episodes.itertuples()]
+
+    return episodes[EPISODE_COLUMNS].sort_values(
+        ["start", "machine_id", "sensor"]).reset_index(drop=True)
+
+
+def print_episodes(episodes: pd.DataFrame):
+    print("\n===============================")
+    print("      ANOMALY ALERT EPISODES")
+    print("===============================")
+    print(f"Total episodes: {len(episodes)} | Alerts merged: {int(episodes['n_alerts'].sum())}\n")
+
+    for _, ep in episodes.iterrows():
+        print(f"[{ep['start']} -> {ep['end']}] {ep['machine_id']} / {ep['sensor']} ({ep['source']})")
+        print(f"Alerts: {ep['n_alerts']}")
+        if pd.notna(ep["peak_rule_score"]):
+            print(f"Peak Rule Score: {ep['peak_rule_score']:.4f}")
+        if pd.notna(ep["peak_ml_score"]):
+            print(f"Peak ML Score: {ep['peak_ml_score']:.4f}")
+        if ep["reasons"]:
+            print(f"Reasons: {ep['reasons']}")
+        print("-" * 70)
@@ -0,0 +1,219 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from .rules import SENSORS
+
+DEFAULT_WINDOWS = (5, 20)
+DEFAULT_EWMA_SPANS = (10,)
+
+
+class RingWindow:
+    """
+    Fixed-size ring buffer that keeps running sums so mean, std and the
+    least-squares slope over the last `size` readings update in O(1).
+    """
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("window size must be >= 1")
+        self.size = size
+        self.buf = [0.0] * size
+        self.head = 0  # slot of the oldest value once the buffer is full
+        self.count = 0
+        self.s_y = 0.0   # sum(y)
+        self.s_yy = 0.0  # sum(y^2)
+        self.s_iy = 0.0  # sum(i * y), i = position in window (0 = oldest)
+        self._since_resync = 0
+
+    def push(self, y: float):
+        if self.count < self.size:
+            self.buf[(self.head + self.count) % self.size] = y
+            self.s_iy += self.count * y
+            self.count += 1
+            self.s_y += y
+            self.s_yy += y * y
+        else:
+            old = self.buf[self.head]
+            self.buf[self.head] = y
+            self.head = (self.head + 1) % self.size
+            # every remaining value moves one position towards the front
+            self.s_iy += (self.size - 1) * y - (self.s_y - old)
+            self.s_y += y - old
+            self.s_yy += y * y - old * old
+
+        # recompute from the buffer once per window to stop float drift
+        self._since_resync += 1
+        if self._since_resync >= self.size:
+            self._resync()
+
+    def _resync(self):
+        values = self.values()
+        self.s_y = math.fsum(values)
+        self.s_yy = math.fsum(v * v for v in values)
+        self.s_iy = math.fsum(i * v for i, v in enumerate(values))
+        self._since_resync = 0
+
+    def values(self) -> list[float]:
+        return [self.buf[(self.head + i) % self.size] for i in range(self.count)]
+
+    def mean(self) -> float:
+        return self.s_y / self.count if self.count else math.nan
+
+    def std(self) -> float:
+        """Population standard deviation (ddof=0)."""
+        if not self.count:
+            return math.nan
+        mean = self.s_y / self.count
+        mean_sq = self.s_yy / self.count
+        var = mean_sq - mean * mean
+        # below this the difference is cancellation noise, e.g. a stuck sensor
+        if var <= 1e-12 * mean_sq:
+            return 0.0
+        return math.sqrt(var)
+
+    def slope(self) -> float:
+        """Least-squares slope per reading; 0 until two readings are buffered."""
+        n = self.count
+        if n < 2:
+            return 0.0 if n else math.nan
+        s_i = n * (n - 1) / 2
+        s_ii = (n - 1) * n * (2 * n - 1) / 6
+        return (n * self.s_iy - s_i * self.s_y) / (n * s_ii - s_i * s_i)
+
+
+def feature_names(sensors=SENSORS, windows=DEFAULT_WINDOWS, ewma_spans=DEFAULT_EWMA_SPANS) -> list[str]:
+    if any(w < 1 for w in windows):
+        raise ValueError("window size must be >= 1")
+    names = []
+    for s in sensors:
+        for w in windows:
+            names += [f"{s}_mean_{w}", f"{s}_std_{w}", f"{s}_slope_{w}"]
+        names += [f"{s}_ewma_{span}" for span in ewma_spans]
+    return names
+
+
+class StreamingFeatureEngine:
+    """
+    Incremental rolling features for one sensor stream (one machine).
+
+    update() takes a single reading and returns the rolling mean, std and
+    slope for every window plus the EWMA for every span, in feature_names order.
+    NaN readings hold the last seen value, matching rolling_features().
+    """
+
+    def __init__(self, sensors=SENSORS, windows=DEFAULT_WINDOWS, ewma_spans=DEFAULT_EWMA_SPANS):
+        self.sensors = list(sensors)
+        self.windows = list(windows)
+        self.ewma_spans = list(ewma_spans)
+        self.feature_names = feature_names(self.sensors, self.windows, self.ewma_spans)
+        self._rings = {s: [RingWindow(w) for w in self.windows] for s in self.sensors}
+        self._alphas = [2.0 / (span + 1.0) for span in self.ewma_spans]
+        self._ewma = {s: [math.nan] * len(self.ewma_spans) for s in self.sensors}
+        self._last = {s: math.nan for s in self.sensors}
+
+    def update(self, reading) -> list[float]:
+        out = []
+        for s in self.sensors:
+            y = float(reading[s])
+            if y != y:  # NaN
+                y = self._last[s]
+            rings = self._rings[s]
+            ewma = self._ewma[s]
+            if y != y:  # nothing seen yet for this sensor
+                out += [math.nan] * (3 * len(rings) + len(ewma))
+                continue
+            self._last[s] = y
+            for ring in rings:
+                ring.push(y)
+                out += [ring.mean(), ring.std(), ring.slope()]
+            for k, alpha in enumerate(self._alphas):
+                prev = ewma[k]
+                ewma[k] = y if prev != prev else alpha * y + (1.0 - alpha) * prev
+            out += ewma
+        return out
+
+    def update_dict(self, reading) -> dict:
+        return dict(zip(self.feature_names, self.update(reading)))
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Feed every row of df through the engine (keeps state for later updates)."""
+        columns = [df[s].to_numpy(dtype=float) for s in self.sensors]
+        rows = [self.update(dict(zip(self.sensors, values))) for values in zip(*columns)]
+        return pd.DataFrame(rows, columns=self.feature_names, index=df.index)
+
+
+class ChunkedRollingFeatures:
+    """
+    Vectorized rolling features over consecutive chunks of one stream.
+    The last max(windows) - 1 readings and the EWMA values are carried
+    between chunks, so transforming a frame chunk by chunk gives the same
+    result as transforming it in one go (and as StreamingFeatureEngine).
+    """
+
+    def __init__(self, sensors=SENSORS, windows=DEFAULT_WINDOWS, ewma_spans=DEFAULT_EWMA_SPANS):
+        self.sensors = list(sensors)
+        self.windows = list(windows)
+        self.ewma_spans = list(ewma_spans)
+        self.feature_names = feature_names(self.sensors, self.windows, self.ewma_spans)
+        self._keep = max(self.windows) - 1
+        self._tail = {s: np.empty(0) for s in self.sensors}
+        self._ewma = {s: None for s in self.sensors}
+
+    def transform(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        features = {}
+        for s in self.sensors:
+            tail = self._tail[s]
+            raw = chunk[s].to_numpy(dtype=float)
+            # NaN readings hold the last value, including one from the previous chunk
+            y = pd.Series(np.concatenate([tail[-1:], raw])).ffill().to_numpy()[len(tail[-1:]):]
+            # leading NaNs (nothing seen yet) are dropped so windows fill up from the first reading
+            valid = ~np.isnan(y)
+            first = int(np.argmax(valid)) if valid.any() else len(y)
+            v = y[first:]
+
+            full = pd.Series(np.concatenate([tail, v]))
+            pos = pd.Series(np.arange(len(full), dtype=float))
+            skip = len(tail)
+            for w in self.windows:
+                roll = full.rolling(w, min_periods=1)
+                # a 1-reading window has slope 0, as in RingWindow
+                slope = full.rolling(w, min_periods=min(w, 2)).cov(pos, ddof=0) / \
+                    pos.rolling(w, min_periods=min(w, 2)).var(ddof=0)
+                features[f"{s}_mean_{w}"] = _pad(roll.mean()[skip:], first)
+                std = roll.std(ddof=0).fillna(0.0)
+                # pandas' online variance leaves ~1e-9 noise on flat windows
+                std = std.where(std > 1e-6 * roll.mean().abs(), 0.0)
+                features[f"{s}_std_{w}"] = _pad(std[skip:], first)
+                features[f"{s}_slope_{w}"] = _pad(slope.fillna(0.0)[skip:], first)
+
+            seeds = self._ewma[s]
+            last = []
+            for k, span in enumerate(self.ewma_spans):
+                if seeds is None:
+                    ewma = pd.Series(v).ewm(span=span, adjust=False).mean().to_numpy()
+                else:
+                    ewma = pd.Series(np.concatenate([[seeds[k]], v])).ewm(
+                        span=span, adjust=False).mean().to_numpy()[1:]
+                features[f"{s}_ewma_{span}"] = _pad(ewma, first)
+                last.append(ewma[-1] if len(ewma) else None)
+
+            if len(v):
+                self._tail[s] = full.to_numpy()[-self._keep:] if self._keep else np.empty(0)
+                self._ewma[s] = last
+        out = pd.DataFrame(features, index=chunk.index)
+        return out[self.feature_names]
+
+
+def rolling_features(df: pd.DataFrame, sensors=SENSORS, windows=DEFAULT_WINDOWS,
+                     ewma_spans=DEFAULT_EWMA_SPANS) -> pd.DataFrame:
+    """
+    Vectorized batch version of StreamingFeatureEngine for training on a
+    whole frame. Produces the same columns and values as streaming the rows.
+    """
+    return ChunkedRollingFeatures(sensors, windows, ewma_spans).transform(df)
+
+
+def _pad(values, n_leading: int) -> np.ndarray:
+    return np.concatenate([np.full(n_leading, np.nan), np.asarray(values, dtype=float)])
@@ -0,0 +1,231 @@
+import numpy as np
+import pandas as pd
+
+from .rules import MACHINE_COL, SENSORS, sensor_excess
+
+METHODS = ("ffill", "interpolate", "hold_last_good")
+
+# fill at most 3 consecutive missing readings by holding the last value
+DEFAULT_POLICY = {"method": "ffill", "max_gap": 3}
+
+MISSING_ALERT_COLUMNS = ["sensor", "start", "end", "n_missing", "continued", "reason"]
+
+
+def _previous_index(mask: np.ndarray) -> np.ndarray:
+    """For each position, the index of the last True at or before it (-1 if none)."""
+    idx = np.where(mask, np.arange(len(mask)), -1)
+    return np.maximum.accumulate(idx) if len(idx) else idx
+
+
+def _next_index(mask: np.ndarray) -> np.ndarray:
+    """For each position, the index of the first True at or after it (len if none)."""
+    n = len(mask)
+    idx = np.where(mask, np.arange(n), n)
+    return np.minimum.accumulate(idx[::-1])[::-1] if n else idx
+
+
+class SensorImputer:
+    """
+    Vectorized missing-value imputation with per-sensor policies.
+
+    policies: {sensor: {"method": ..., "max_gap": ...}}; sensors not listed
+              use DEFAULT_POLICY.
+      - "ffill": hold the last reading
+      - "interpolate": linear between the readings around a gap once the gap
+        has closed; a gap still open at the end of the data is held like ffill
+      - "hold_last_good": hold the last reading that was inside the strict
+        thresholds, so a failing sensor does not repeat its bad value
+      max_gap: most consecutive missing readings that are filled (None = no
+        limit). Longer gaps stay NaN and raise a "sensor missing" alert.
+
+    The last readings and the open gap length are carried between calls, so
+    transform() can be applied chunk by chunk to a stream; calling it once
+    on a whole frame is the batch mode.
+    """
+
+    def __init__(self, policies: dict = None, sensors=SENSORS):
+        self.sensors = list(sensors)
+        self.policies = {}
+        for s in self.sensors:
+            policy = {**DEFAULT_POLICY, **(policies or {}).get(s, {})}
+            if policy["method"] not in METHODS:
+                raise ValueError(f"Unknown imputation method for {s}: {policy['method']}")
+            if policy["max_gap"] is not None and policy["max_gap"] < 0:
+                raise ValueError(f"max_gap for {s} must be >= 0 or None")
+            self.policies[s] = policy
+        self._last = {s: np.nan for s in self.sensors}       # last observed reading
+        self._last_good = {s: np.nan for s in self.sensors}  # last in-range reading (hold_last_good)
+        self._run = {s: 0 for s in self.sensors}             # missing readings since _last
+        self._alert_open = {s: False for s in self.sensors}  # previous chunk ended unfilled
+
+    def impute_column(self, sensor: str, values: np.ndarray) -> np.ndarray:
+        """
+        Fill `values` (float array) in place according to the sensor's policy.
+        Returns the boolean mask of readings that are still missing.
+        """
+        policy = self.policies[sensor]
+        method, max_gap = policy["method"], policy["max_gap"]
+        n = len(values)
+        missing = np.isnan(values)
+        if n == 0:
+            return missing
+        if not missing.any():
+            # nothing to fill (values may be read-only here): only carry the state
+            self._last[sensor] = values[-1]
+            self._run[sensor] = 0
+            if method == "hold_last_good":
+                good_idx = np.flatnonzero(sensor_excess(values, sensor) == 0)
+                if len(good_idx):
+                    self._last_good[sensor] = values[good_idx[-1]]
+            return missing
+        if method == "ffill":
+            return self._ffill(sensor, values, missing, max_gap)
+        observed = ~missing
+        prev = _previous_index(observed)
+        last = self._last[sensor]
+
+        # work on the missing positions only; prev may sit in an earlier chunk
+        idx = np.flatnonzero(missing)
+        p = prev[idx]
+        prev_pos = np.where(p >= 0, p, -1 - self._run[sensor])
+        has_prev = (p >= 0) | (not np.isnan(last))
+        fill = has_prev
+        if max_gap is not None:
+            fill = fill & ((idx - prev_pos) <= max_gap)
+
+        hold = np.where(p >= 0, values[np.maximum(p, 0)], last)
+        if method == "hold_last_good":
+            good = observed & (sensor_excess(values, sensor) == 0)
+            prev_good = _previous_index(good)
+            g = prev_good[idx]
+            carried = self._last_good[sensor]
+            good_hold = np.where(g >= 0, values[np.maximum(g, 0)], carried)
+            # no good reading yet: fall back to the last observed one
+            hold = np.where(np.isnan(good_hold), hold, good_hold)
+        elif method == "interpolate":
+            nxt = _next_index(observed)[idx]
+            interp = has_prev & (nxt < n)
+            if max_gap is not None:
+                interp &= (nxt - prev_pos - 1) <= max_gap
+            if interp.any():
+                next_values = values[np.minimum(nxt, n - 1)]
+                frac = (idx - prev_pos) / np.where(interp, nxt - prev_pos, 1)
+                hold = np.where(interp, hold + (next_values - hold) * frac, hold)
+
+        values[idx[fill]] = hold[fill]
+        missing[idx[fill]] = False
+
+        # carry state for the next chunk
+        if prev[-1] >= 0:
+            self._last[sensor] = values[prev[-1]]
+            self._run[sensor] = n - 1 - prev[-1]
+        else:
+            self._run[sensor] += n
+        if method == "hold_last_good" and prev_good[-1] >= 0:
+            self._last_good[sensor] = values[prev_good[-1]]
+        return missing
+
+    def _ffill(self, sensor, values, missing, max_gap) -> np.ndarray:
+        """
+        ffill through pandas' single-pass fill, seeded with the carried
+        reading and the part of max_gap the open gap has already used.
+        """
+        last, run = self._last[sensor], self._run[sensor]
+        observed = np.flatnonzero(~missing)
+        if max_gap != 0:
+            if np.isnan(last):
+                head = np.empty(0)
+            else:
+                used = 0 if max_gap is None else min(run, max_gap)
+                head = np.concatenate([[last], np.full(used, np.nan)])
+            series = pd.Series(np.concatenate([head, values]) if len(head) else values, copy=False)
+            values[:] = series.ffill(limit=max_gap).to_numpy()[len(head):]
+
+        if len(observed):
+            self._last[sensor] = values[observed[-1]]
+            self._run[sensor] = len(values) - 1 - observed[-1]
+        else:
+            self._run[sensor] += len(values)
+        return np.isnan(values)
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Impute the sensor columns of df in place and return the "sensor
+        missing" alerts: one row per run of readings left unfilled.
+        `continued` marks runs that were already open at the start of df.
+
+        A float64 column whose buffer pandas exposes as writable is filled
+        in that buffer. Under copy-on-write (pandas 3) the buffer is
+        read-only, so a column with missing readings is copied once and
+        assigned back. Columns without missing readings are never copied.
+        """
+        runs = []
+        for s in self.sensors:
+            col = df[s].to_numpy()
+            if col.dtype == np.float64 and (col.flags.writeable or not np.isnan(col).any()):
+                values, write_back = col, False
+            else:
+                values, write_back = np.array(col, dtype=float), True
+            unfilled = self.impute_column(s, values)
+            if write_back:
+                df[s] = values
+            if unfilled.any():
+                runs.append((s, *_missing_runs(unfilled, self._alert_open[s] and unfilled[0])))
+            if len(unfilled):
+                self._alert_open[s] = bool(unfilled[-1])
+        if not runs:
+            return pd.DataFrame(columns=MISSING_ALERT_COLUMNS)
+
+        # one frame per chunk: per-sensor frames cost more than the imputation
+        timestamps = df["timestamp"].to_numpy() if "timestamp" in df else df.index.to_numpy()
+        sensors = np.concatenate([np.full(len(starts), s, dtype=object) for s, starts, _, _ in runs])
+        reasons = np.concatenate([np.full(len(starts), f"Sensor missing ({s})", dtype=object)
+                                  for s, starts, _, _ in runs])
+        starts = np.concatenate([r[1] for r in runs])
+        ends = np.concatenate([r[2] for r in runs])
+        continued = np.concatenate([r[3] for r in runs])
+        # by start, then sensor (runs are already grouped in sensor order)
+        order = np.argsort(starts, kind="stable")
+        return pd.DataFrame({
+            "sensor": sensors[order],
+            "start": timestamps[starts[order]],
+            "end": timestamps[ends[order]],
+            "n_missing": (ends - starts + 1)[order],
+            "continued": continued[order],
+            "reason": reasons[order],
+        })
+
+
+def _missing_runs(unfilled, first_continued):
+    """(starts, ends, continued) of the runs of True in unfilled."""
+    edges = np.diff(np.concatenate([[False], unfilled, [False]]).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    continued = np.zeros(len(starts), dtype=bool)
+    continued[0] = bool(first_continued) and starts[0] == 0
+    return starts, ends, continued
+
+
+def merge_missing_alerts(parts) -> pd.DataFrame:
+    """
+    Join per-chunk missing alerts whose run continued across a chunk boundary
+    (per machine when the alerts carry a machine_id).
+    """
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return pd.DataFrame(columns=MISSING_ALERT_COLUMNS)
+    alerts = pd.concat(parts, ignore_index=True)
+    keys = [MACHINE_COL, "sensor"] if MACHINE_COL in alerts else ["sensor"]
+    alerts = alerts.sort_values(keys + ["start"], kind="stable").reset_index(drop=True)
+    same_stream = np.all([alerts[k] == alerts[k].shift() for k in keys], axis=0)
+    run = (~alerts["continued"].astype(bool) | ~same_stream).cumsum()
+    merged = alerts.groupby(run, sort=False).agg(
+        **{k: (k, "first") for k in keys},
+        start=("start", "first"),
+        end=("end", "last"),
+        n_missing=("n_missing", "sum"),
+    )
+    merged["continued"] = False
+    merged["reason"] = "Sensor missing (" + merged["sensor"] + ")"
+    columns = keys[:-1] + MISSING_ALERT_COLUMNS
+    return merged[columns].sort_values(["start"] + keys).reset_index(drop=True)
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import shap
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from .features import DEFAULT_EWMA_SPANS, DEFAULT_WINDOWS, feature_names, rolling_features
+from .rules import SENSORS
+
+LABELS = {"normal": 0, "abnormal": 1}
+
+
+class MLDetector:
+    """
+    RandomForest anomaly classifier on the raw sensors plus rolling-window
+    features, with SHAP explanations for the rows it flags.
+
+    threshold: probability of "abnormal" at which a row is flagged; None
+               keeps the classifier's own argmax decision.
+    """
+
+    def __init__(self, n_estimators=100, max_depth=None, random_state=50, class_weight="balanced",
+                 windows=DEFAULT_WINDOWS, ewma_spans=DEFAULT_EWMA_SPANS, shap_threshold=0.1,
+                 n_jobs=None, threshold=None):
+        self.windows = tuple(windows)
+        self.ewma_spans = tuple(ewma_spans)
+        self.shap_threshold = shap_threshold
+        self.threshold = threshold
+        self.feature_names = list(SENSORS) + feature_names(SENSORS, self.windows, self.ewma_spans)
+        self.scaler = StandardScaler()
+        self.clf = RandomForestClassifier(
+            n_estimators=n_estimators,
+            max_depth=max_depth,
+            random_state=random_state,
+            class_weight=class_weight,
+            n_jobs=n_jobs,
+        )
+        self.explainer = None
+
+    def features(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Raw sensors plus rolling features for a whole frame."""
+        return pd.concat([df[SENSORS], rolling_features(df, SENSORS, self.windows, self.ewma_spans)],
+                         axis=1)
+
+    def fit(self, df: pd.DataFrame, features: pd.DataFrame = None):
+        """Train on df (needs a normal/abnormal `label` column)."""
+        if "label" not in df:
+            raise ValueError("Training data needs a 'label' column (normal/abnormal)")
+        if features is None:
+            features = self.features(df)
+        y = df["label"].map(LABELS)
+
+        X_train = self.scaler.fit_transform(features[self.feature_names])
+        self.clf.fit(X_train, y)
+        self.explainer = shap.TreeExplainer(self.clf, data=X_train, model_output="probability")
+        return self
+
+    def predict(self, features: pd.DataFrame):
+        """Returns (ml_pred, ml_score) arrays for every row of features."""
+        X = self.scaler.transform(features[self.feature_names])
+        proba = self.clf.predict_proba(X)
+        if self.threshold is not None:
+            return (proba[:, 1] >= self.threshold).astype(int), proba[:, 1]
+        # same as clf.predict() without running the forest twice
+        pred = self.clf.classes_[proba.argmax(axis=1)]
+        return pred, proba[:, 1]
+
+    def explain(self, features: pd.DataFrame) -> list[str]:
+        """Features whose SHAP contribution towards "abnormal" exceeds shap_threshold."""
+        if len(features) == 0:
+            return []
+        X = self.scaler.transform(features[self.feature_names])
+        shap_values = np.asarray(self.explainer(X).values)
+        shap_for_pos = shap_values[:, :, 1]
+
+        explanations = []
+        for row_shap in shap_for_pos:
+            contributions = [
+                f
+                for f, v in zip(self.feature_names, row_shap)
+                if v > self.shap_threshold
+            ]
+            explanations.append("; ".join(contributions) if contributions else "Unclear")
+        return explanations
+
+    def detect(self, df: pd.DataFrame, features: pd.DataFrame = None) -> pd.DataFrame:
+        """
+        Rows of df the classifier flags as abnormal, with ml_pred, ml_score and
+        ml_explanation columns (the notebook's `ml_anomalies`).
+        """
+        if features is None:
+            features = self.features(df)
+        pred, score = self.predict(features)
+        rows = np.flatnonzero(pred == 1)
+
+        ml_anomalies = df.iloc[rows].copy()
+        ml_anomalies["ml_pred"] = pred[rows]
+        ml_anomalies["ml_score"] = score[rows]
+        ml_anomalies["ml_explanation"] = self.explain(features.iloc[rows])
+        return ml_anomalies
@@ -0,0 +1,326 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from .data import generate_dummy_data, read_sensor_chunks
+from .imputation import SensorImputer
+from .ml_detector import LABELS, MLDetector
+from .rules import SENSORS
+
+DEFAULT_GRID = {
+    "n_estimators": [25, 50, 100, 200],
+    "max_depth": [None, 4, 8],
+    "threshold": [0.3, 0.5, 0.7],
+}
+
+COST_COLUMNS = ["predict_us_per_row", "n_nodes", "fit_s"]
+
+
+def walk_forward_splits(n_rows: int, n_splits: int = 5, min_train: int = None) -> list[tuple[int, int]]:
+    """
+    Expanding-window splits as (train_end, test_end): each fold trains on
+    rows [0, train_end) and is tested on the next block [train_end, test_end),
+    so the model never sees readings from after the ones it is scored on.
+    min_train defaults to an equal share of n_splits + 1 blocks.
+    """
+    if min_train is None:
+        min_train = n_rows // (n_splits + 1)
+    test_size = (n_rows - min_train) // n_splits if n_splits > 0 else 0
+    if min_train < 1 or test_size < 1:
+        raise ValueError(f"Cannot make {n_splits} walk-forward splits of {n_rows} rows "
+                         f"with min_train={min_train}")
+    return [(min_train + k * test_size,
+             min_train + (k + 1) * test_size if k < n_splits - 1 else n_rows)
+            for k in range(n_splits)]
+
+
+def alert_latencies(y_true: np.ndarray, alerts: np.ndarray) -> np.ndarray:
+    """
+    Readings from the start of each abnormal run in y_true to the first
+    alert inside it; -1 for runs that were never alerted.
+    """
+    edges = np.diff(np.concatenate([[0], y_true.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    alert_pos = np.flatnonzero(alerts)
+    if len(alert_pos) == 0:
+        return np.full(len(starts), -1)
+    first = alert_pos[np.minimum(np.searchsorted(alert_pos, starts), len(alert_pos) - 1)]
+    detected = (first >= starts) & (first <= ends)
+    return np.where(detected, first - starts, -1)
+
+
+class SharedArrays:
+    """
+    Numpy arrays packed into one shared-memory block. Worker processes
+    attach by name (see attach()) and get read-only views instead of a
+    pickled copy per task.
+    """
+
+    def __init__(self, arrays: dict):
+        self.layout = {}
+        offset = 0
+        for key, a in arrays.items():
+            a = np.ascontiguousarray(a)
+            self.layout[key] = (offset, a.shape, a.dtype.str)
+            offset += a.nbytes
+        self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        for key, a in arrays.items():
+            self._view(self.shm, key)[...] = a
+
+    @property
+    def spec(self) -> tuple:
+        return self.shm.name, self.layout
+
+    def _view(self, shm, key) -> np.ndarray:
+        offset, shape, dtype = self.layout[key]
+        return np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+
+    @staticmethod
+    def attach(spec) -> tuple:
+        """(shm, {key: array view}) for a spec from another process."""
+        name, layout = spec
+        try:
+            # the creating process owns the block; attachers must not unlink it
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13
+            shm = shared_memory.SharedMemory(name=name)
+        arrays = {}
+        for key, (offset, shape, dtype) in layout.items():
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            arrays[key].flags.writeable = False
+        return shm, arrays
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# set once per worker process by _init_worker
+_WORKER = {}
+
+
+def _init_worker(spec):
+    _WORKER["shm"], _WORKER["arrays"] = SharedArrays.attach(spec)
+
+
+def _evaluate(task) -> list[dict]:
+    """Fit one forest on a fold and score every threshold on its test block."""
+    fold, train_end, test_end, n_estimators, max_depth, thresholds = task
+    X = _WORKER["arrays"][f"X{fold}"]
+    y = _WORKER["arrays"]["y"]
+    y_test = y[train_end:test_end]
+
+    # one core per fit: the pool already spreads fits across cores
+    clf = MLDetector(n_estimators=n_estimators, max_depth=max_depth, n_jobs=1).clf
+    start = time.perf_counter()
+    clf.fit(X[:train_end], y[:train_end])
+    fit_s = time.perf_counter() - start
+
+    # best of a few runs: a single predict on a small block is mostly noise
+    predict_s = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        proba = clf.predict_proba(X[train_end:test_end])
+        predict_s = min(predict_s, time.perf_counter() - start)
+    classes = list(clf.classes_)
+    score = proba[:, classes.index(1)] if 1 in classes else np.zeros(len(y_test))
+    n_nodes = sum(tree.tree_.node_count for tree in clf.estimators_)
+
+    rows = []
+    for threshold in thresholds:
+        alerts = score >= threshold
+        latency = alert_latencies(y_test, alerts)
+        rows.append({
+            "n_estimators": n_estimators,
+            "max_depth": max_depth,
+            "threshold": threshold,
+            "fold": fold,
+            "tp": int(np.sum(alerts & (y_test == 1))),
+            "fp": int(np.sum(alerts & (y_test == 0))),
+            "fn": int(np.sum(~alerts & (y_test == 1))),
+            "episodes": len(latency),
+            "detected": int(np.sum(latency >= 0)),
+            "latency_sum": int(latency[latency >= 0].sum()),
+            "test_rows": len(y_test),
+            "fit_s": fit_s,
+            "predict_s": predict_s,
+            "n_nodes": n_nodes,
+        })
+    return rows
+
+
+def _summarize(folds: pd.DataFrame) -> pd.DataFrame:
+    keys = ["n_estimators", "max_depth", "threshold"]
+    totals = folds.groupby(keys, dropna=False, sort=False).agg(
+        tp=("tp", "sum"), fp=("fp", "sum"), fn=("fn", "sum"),
+        episodes=("episodes", "sum"), detected=("detected", "sum"),
+        latency_sum=("latency_sum", "sum"), test_rows=("test_rows", "sum"),
+        predict_s=("predict_s", "sum"), fit_s=("fit_s", "mean"), n_nodes=("n_nodes", "mean"),
+    ).reset_index()
+
+    out = totals[keys].copy()
+    # groupby turns the None (unlimited) depth into NaN
+    out["max_depth"] = pd.Series([None if pd.isna(d) else int(d) for d in out["max_depth"]],
+                                 index=out.index, dtype=object)
+    out["precision"] = totals["tp"] / (totals["tp"] + totals["fp"]).where(lambda d: d > 0)
+    out["recall"] = totals["tp"] / (totals["tp"] + totals["fn"]).where(lambda d: d > 0)
+    out["episode_recall"] = totals["detected"] / totals["episodes"].where(lambda d: d > 0)
+    # mean readings from the start of an abnormal run to its first alert
+    out["alert_latency"] = totals["latency_sum"] / totals["detected"].where(lambda d: d > 0)
+    out["predict_us_per_row"] = totals["predict_s"] / totals["test_rows"] * 1e6
+    out["n_nodes"] = totals["n_nodes"]
+    out["fit_s"] = totals["fit_s"]
+    out[["precision", "recall", "episode_recall"]] = out[["precision", "recall", "episode_recall"]].fillna(0.0)
+    return out
+
+
+def walk_forward_cv(df: pd.DataFrame, grid: dict = None, n_splits: int = 5, min_train: int = None,
+                    n_jobs: int = None, features: pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Walk-forward validation of the RandomForest over a grid of n_estimators,
+    max_depth and alert threshold.
+
+    df needs the sensor columns and a normal/abnormal `label`. Features are
+    computed once (they only look backwards) and scaled per fold on that
+    fold's training rows. Rows with a sensor still missing (gaps the imputer
+    left open) feed the rolling features but are neither trained on nor
+    scored, as in run_pipeline; the scaled arrays go into shared memory and the
+    (fold, n_estimators, max_depth) fits run on a pool of n_jobs processes
+    (None = 1, -1 = all cores). Thresholds reuse each fit's probabilities.
+
+    Returns one row per configuration with precision/recall over the pooled
+    test blocks, episode recall, alert latency (readings) and inference cost
+    (predict µs per row, tree nodes, mean fit seconds).
+    """
+    if "label" not in df:
+        raise ValueError("Walk-forward validation needs a 'label' column (normal/abnormal)")
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    detector = MLDetector()
+    if features is None:
+        features = detector.features(df)
+    complete = df[SENSORS].notna().all(axis=1).to_numpy()
+    X = features[detector.feature_names].to_numpy(dtype=float)[complete]
+    y = df["label"].map(LABELS).to_numpy(dtype=np.int8)[complete]
+    splits = walk_forward_splits(len(y), n_splits, min_train)
+
+    arrays = {"y": y}
+    for fold, (train_end, test_end) in enumerate(splits):
+        scaler = StandardScaler().fit(X[:train_end])
+        arrays[f"X{fold}"] = scaler.transform(X[:test_end])
+
+    thresholds = list(grid["threshold"])
+    tasks = [(fold, train_end, test_end, n_estimators, max_depth, thresholds)
+             for (fold, (train_end, test_end)), n_estimators, max_depth
+             in product(enumerate(splits), grid["n_estimators"], grid["max_depth"])]
+    # largest forests first so the pool is not left waiting on one at the end
+    tasks.sort(key=lambda t: -t[3])
+
+    n_jobs = os.cpu_count() if n_jobs == -1 else (n_jobs or 1)
+    with SharedArrays(arrays) as shared:
+        if n_jobs == 1:
+            _init_worker(shared.spec)
+            try:
+                rows = [r for task in tasks for r in _evaluate(task)]
+            finally:
+                _WORKER.pop("shm").close()
+                _WORKER.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                                     initargs=(shared.spec,)) as pool:
+                rows = [r for result in pool.map(_evaluate, tasks) for r in result]
+
+    results = _summarize(pd.DataFrame(rows))
+    return results.sort_values(["n_estimators", "max_depth", "threshold"],
+                               na_position="last").reset_index(drop=True)
+
+
+def select_cheapest(results: pd.DataFrame, recall_target: float,
+                    cost: str = "predict_us_per_row") -> pd.Series:
+    """
+    Cheapest configuration (by `cost`) whose recall meets recall_target,
+    ties broken by precision. None if no configuration reaches the target.
+    """
+    if cost not in COST_COLUMNS:
+        raise ValueError(f"cost must be one of {COST_COLUMNS}")
+    candidates = results[results["recall"] >= recall_target]
+    if candidates.empty:
+        return None
+    return candidates.sort_values([cost, "precision"], ascending=[True, False]).iloc[0]
+
+
+def _max_depth(value: str):
+    return None if value.lower() == "none" else int(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Walk-forward validation and sweep of the ML detector")
+    parser.add_argument("--input", type=str, default=None,
+                        help="CSV or Parquet file with timestamp, sensors and label. "
+                             "Omit to use generated data.")
+    parser.add_argument("--n_rows", type=int, default=2000,
+                        help="Rows of generated data when --input is omitted")
+    parser.add_argument("--n_splits", type=int, default=5)
+    parser.add_argument("--min_train", type=int, default=None,
+                        help="Rows in the first training window (default: an equal block)")
+    parser.add_argument("--n_estimators", type=int, nargs="+", default=DEFAULT_GRID["n_estimators"])
+    parser.add_argument("--max_depth", type=_max_depth, nargs="+", default=DEFAULT_GRID["max_depth"],
+                        help="Depths to try; 'none' for unlimited")
+    parser.add_argument("--thresholds", type=float, nargs="+", default=DEFAULT_GRID["threshold"],
+                        help="Alert probability thresholds")
+    parser.add_argument("--n_jobs", type=int, default=-1,
+                        help="Worker processes (-1 = all cores)")
+    parser.add_argument("--recall_target", type=float, default=0.9)
+    parser.add_argument("--cost", choices=COST_COLUMNS, default="predict_us_per_row",
+                        help="Cost the cheapest model is picked by")
+    parser.add_argument("--out", type=str, default=None, help="Write the results table to this CSV")
+    args = parser.parse_args(argv)
+
+    if args.input:
+        df = pd.concat(read_sensor_chunks(args.input), ignore_index=True)
+    else:
+        df = generate_dummy_data(n_rows=args.n_rows, interval_minutes=5,
+                                 anomaly_rate=0.15, introduce_missing=True)
+    SensorImputer().transform(df)
+    unscored = int(df[SENSORS].isna().any(axis=1).sum())
+
+    grid = {"n_estimators": args.n_estimators, "max_depth": args.max_depth,
+            "threshold": args.thresholds}
+    start = time.perf_counter()
+    results = walk_forward_cv(df, grid, n_splits=args.n_splits, min_train=args.min_train,
+                              n_jobs=args.n_jobs)
+    elapsed = time.perf_counter() - start
+
+    with pd.option_context("display.max_rows", None, "display.width", 120):
+        print(results.round(4).to_string(index=False))
+    print(f"\n{len(results)} configurations x {args.n_splits} folds on {len(df) - unscored} rows "
+          f"({unscored} left out with sensors still missing) in {elapsed:.2f}s (n_jobs={args.n_jobs})")
+    if args.out:
+        results.to_csv(args.out, index=False)
+
+    best = select_cheapest(results, args.recall_target, args.cost)
+    if best is None:
+        print(f"No configuration reaches recall {args.recall_target}")
+    else:
+        print(f"Cheapest model with recall >= {args.recall_target}: "
+              f"MLDetector(n_estimators={int(best['n_estimators'])}, max_depth={best['max_depth']}, "
+              f"threshold={best['threshold']}) | precision {best['precision']:.3f} | "
+              f"recall {best['recall']:.3f} | {best['predict_us_per_row']:.2f} us/row")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import urllib.request
+
+import pandas as pd
+
+
+def episode_records(episodes: pd.DataFrame) -> list[dict]:
+    """Convert an episodes frame into JSON-serialisable notification payloads."""
+    records = []
+    for ep in episodes.to_dict("records"):
+        record = {}
+        for key, value in ep.items():
+            if isinstance(value, pd.Timestamp):
+                value = value.isoformat()
+            elif pd.isna(value):
+                value = None
+            elif hasattr(value, "item"):  # numpy scalar
+                value = value.item()
+            record[key] = value
+        records.append(record)
+    return records
+
+
+class FileSink:
+    """
+    Appends each batch to a local JSON-lines file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def _write(self, batch: list[dict]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in batch:
+                f.write(json.dumps(record) + "\n")
+
+    async def send(self, batch: list[dict]):
+        await asyncio.to_thread(self._write, batch)
+
+
+class WebhookSink:
+    """
+    POSTs each batch as a JSON array to a webhook URL.
+    """
+
+    def __init__(self, url: str, timeout: float = 5.0):
+        self.url = url
+        self.timeout = timeout
+
+    def _post(self, batch: list[dict]):
+        req = urllib.request.Request(
+            self.url,
+            data=json.dumps(batch).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            resp.read()
+
+    async def send(self, batch: list[dict]):
+        await asyncio.to_thread(self._post, batch)
+
+
+class AlertDispatcher:
+    """
+    Async notification dispatcher: collects episodes into batches of up to
+    batch_size (or whatever arrived within flush_interval seconds) and sends
+    at most max_batches_per_sec batches to the sink.
+    """
+
+    def __init__(self, sink, batch_size: int = 20, max_batches_per_sec: float = 1.0,
+                 flush_interval: float = 1.0):
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if max_batches_per_sec <= 0:
+            raise ValueError("max_batches_per_sec must be > 0")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.min_send_interval = 1.0 / max_batches_per_sec
+        self.flush_interval = flush_interval
+        self.sent_batches = 0
+        self.sent_records = 0
+        self.failed_batches = 0
+        self._queue = None
+        self._worker = None
+        self._last_send = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def submit(self, record: dict):
+        await self._queue.put(record)
+
+    async def close(self):
+        """Flush everything still queued and stop the worker."""
+        await self._queue.put(None)
+        await self._worker
+
+    async def _next_batch(self):
+        loop = asyncio.get_running_loop()
+        first = await self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                record = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if record is None:
+                return batch, True
+            batch.append(record)
+        return batch, False
+
+    async def _send(self, batch: list[dict]):
+        loop = asyncio.get_running_loop()
+        if self._last_send is not None:
+            wait = self._last_send + self.min_send_interval - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        self._last_send = loop.time()
+        try:
+            await self.sink.send(batch)
+            self.sent_batches += 1
+            self.sent_records += len(batch)
+        except Exception as e:
+            self.failed_batches += 1
+            print(f"Debug - alert dispatch error: {e}")
+
+    async def _run(self):
+        done = False
+        while not done:
+            batch, done = await self._next_batch()
+            if batch:
+                await self._send(batch)
+
+    async def dispatch(self, episodes: pd.DataFrame) -> int:
+        """Send every episode and wait until all batches are flushed."""
+        await self.start()
+        for record in episode_records(episodes):
+            await self.submit(record)
+        await self.close()
+        return self.sent_records
+
+
+def dispatch_episodes(episodes: pd.DataFrame, sink, **kwargs) -> int:
+    """Blocking wrapper around AlertDispatcher.dispatch for scripts without an event loop."""
+    return asyncio.run(AlertDispatcher(sink, **kwargs).dispatch(episodes))
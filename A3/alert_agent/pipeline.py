@@ -0,0 +1,261 @@
+import copy
+import time
+
+import pandas as pd
+
+from .alerts import build_combined_alerts
+from .episodes import build_alert_episodes
+from .features import ChunkedRollingFeatures
+from .imputation import SensorImputer, merge_missing_alerts
+from .ml_detector import MLDetector
+from .rules import MACHINE_COL, RULE_ANOMALY_COLUMNS, SENSORS, detect_rule_anomalies
+
+STAGES = ["load", "impute", "features", "rules", "ml", "explain", "merge", "episodes"]
+
+
+class StageTimer:
+    """
+    Accumulates wall time and rows processed per pipeline stage.
+    """
+
+    def __init__(self):
+        self.seconds = {}
+        self.rows = {}
+
+    def add(self, stage: str, seconds: float, rows: int):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.rows[stage] = self.rows.get(stage, 0) + rows
+
+    def report(self) -> pd.DataFrame:
+        stages = [s for s in STAGES if s in self.seconds] + \
+            [s for s in self.seconds if s not in STAGES]
+        report = pd.DataFrame({
+            "stage": stages,
+            "rows": [self.rows[s] for s in stages],
+            "seconds": [self.seconds[s] for s in stages],
+        })
+        report["rows_per_sec"] = report["rows"] / report["seconds"].where(report["seconds"] > 0)
+        return report
+
+    def print_report(self):
+        report = self.report()
+        print(f"\n{'stage':<10} | {'rows':>10} | {'seconds':>9} | {'rows/sec':>12}")
+        print("-" * 50)
+        for row in report.itertuples():
+            rate = f"{row.rows_per_sec:12.0f}" if pd.notna(row.rows_per_sec) else f"{'-':>12}"
+            print(f"{row.stage:<10} | {row.rows:>10} | {row.seconds:>9.3f} | {rate}")
+        print(f"{'total':<10} | {'':>10} | {report['seconds'].sum():>9.3f} |")
+
+
+def infer_max_gap(timestamps, machines=None):
+    """
+    Median spacing between consecutive readings of the same machine, used as
+    the episode gap. Readings that share a timestamp (several machines, or no
+    machine column) are ignored; returns None when no spacing can be seen yet.
+    """
+    timestamps = pd.Series(pd.to_datetime(timestamps)).reset_index(drop=True)
+    if machines is None:
+        diffs = timestamps.sort_values().diff()
+    else:
+        frame = pd.DataFrame({"machine": pd.Series(machines).to_numpy(), "timestamp": timestamps})
+        diffs = frame.sort_values("timestamp", kind="stable").groupby("machine", sort=False)["timestamp"].diff()
+    diffs = diffs[diffs > pd.Timedelta(0)]
+    return diffs.median() if len(diffs) else None
+
+
+def machine_groups(chunk: pd.DataFrame) -> dict:
+    """Row positions per machine_id ({None: None} = whole chunk, no machine column)."""
+    if MACHINE_COL not in chunk:
+        return {None: None}
+    return chunk.groupby(MACHINE_COL, sort=False).indices
+
+
+def machine_rolling_features(chunk: pd.DataFrame, states: dict, windows, ewma_spans) -> pd.DataFrame:
+    """
+    Rolling features computed per machine, so windows never mix machines;
+    `states` maps machine_id to its ChunkedRollingFeatures and is filled in
+    as machines appear.
+    """
+    parts = []
+    for machine, idx in machine_groups(chunk).items():
+        if machine not in states:
+            states[machine] = ChunkedRollingFeatures(SENSORS, windows, ewma_spans)
+        parts.append(states[machine].transform(chunk if idx is None else chunk.iloc[idx]))
+    rolled = parts[0] if len(parts) == 1 else pd.concat(parts).loc[chunk.index]
+    return pd.concat([chunk[SENSORS], rolled], axis=1)
+
+
+def run_pipeline(chunks, train_rows: int = 50, detector: MLDetector = None, max_gap=None,
+                 timer: StageTimer = None, imputer: SensorImputer = None) -> dict:
+    """
+    Run impute / detect / explain / merge over an iterable of reading chunks.
+
+    chunks: DataFrames with timestamp, temp, pressure, vibration (and `label`
+            in the first train_rows rows if detector still has to be trained).
+    detector: an already fitted MLDetector; otherwise a new one is trained on
+              the first train_rows readings, as in the notebook. Chunks are
+              held back until that many readings have arrived, so the
+              training set does not depend on the chunk size.
+    max_gap: episode gap; when None, the median spacing between readings of
+             the same machine over the first max(train_rows, 2) readings
+             (doubled until some spacing shows), whatever the chunk size.
+    imputer: SensorImputer with the per-sensor fill policies; chunks are
+             imputed in place. Defaults to SensorImputer() (ffill, max_gap 3).
+    A machine_id column splits imputation, rolling features and episodes
+    per machine; readings of one machine must arrive in time order.
+    Readings with a sensor still missing after imputation feed the rolling
+    windows but are neither trained on nor scored by the rules or the
+    model; they are already reported in missing_alerts and counted in
+    unscored_rows.
+    Returns rule_anomalies, ml_anomalies, merged_alerts, episodes,
+    missing_alerts, unscored_rows and the timer.
+    """
+    timer = timer or StageTimer()
+    imputer = imputer or SensorImputer()
+    # every machine carries its own imputation and rolling-window state
+    pristine_imputer = copy.deepcopy(imputer)
+    imputers, rolling = {}, {}
+    rule_parts, ml_parts, missing_parts = [], [], []
+    sensor_cols = None
+    n_rows = unscored_rows = 0
+    # chunks held back until train_rows readings are there to train on
+    pending, pending_rows = [], 0
+    # leading timestamps held until the episode gap can be inferred from them
+    gap_sample, gap_rows, gap_limit = [], 0, max(train_rows, 2)
+
+    def sample_gap(chunk=None):
+        nonlocal max_gap, gap_sample, gap_rows, gap_limit
+        final = chunk is None
+        if not final:
+            gap_sample.append(chunk[[c for c in ("timestamp", MACHINE_COL) if c in chunk]])
+            gap_rows += len(chunk)
+        # cut at fixed row counts, so the inferred gap does not depend on the chunk size
+        while max_gap is None and gap_sample and (gap_rows >= gap_limit or final):
+            sample = pd.concat(gap_sample).iloc[:gap_limit]
+            machines = sample[MACHINE_COL] if MACHINE_COL in sample else None
+            max_gap = infer_max_gap(sample["timestamp"], machines)
+            if gap_rows <= gap_limit:
+                break
+            gap_limit *= 2
+        if max_gap is not None or final:
+            gap_sample = []
+
+    def impute(chunk):
+        for machine, idx in machine_groups(chunk).items():
+            if machine not in imputers:
+                imputers[machine] = imputer if not imputers else copy.deepcopy(pristine_imputer)
+            if idx is None:
+                missing_parts.append(imputers[machine].transform(chunk))
+                continue
+            part = chunk.iloc[idx].copy()
+            alerts = imputers[machine].transform(part)
+            chunk.iloc[idx, sensor_cols] = part[SENSORS].to_numpy()
+            alerts.insert(0, MACHINE_COL, machine)
+            missing_parts.append(alerts)
+
+    def score(chunk):
+        nonlocal unscored_rows
+
+        start = time.perf_counter()
+        features = machine_rolling_features(chunk, rolling, detector.windows, detector.ewma_spans)
+        timer.add("features", time.perf_counter() - start, len(chunk))
+        # gaps longer than the imputer's max_gap stay NaN: nothing to score there
+        complete = chunk[SENSORS].notna().all(axis=1).to_numpy()
+        if not complete.all():
+            unscored_rows += int((~complete).sum())
+            chunk, features = chunk[complete], features[complete]
+
+        start = time.perf_counter()
+        rule_parts.append(detect_rule_anomalies(chunk))
+        timer.add("rules", time.perf_counter() - start, len(chunk))
+
+        start = time.perf_counter()
+        if chunk.empty:
+            return
+        pred, score = detector.predict(features)
+        rows = pred == 1
+        ml_anomalies = chunk[rows].copy()
+        ml_anomalies["ml_pred"] = pred[rows]
+        ml_anomalies["ml_score"] = score[rows]
+        timer.add("ml", time.perf_counter() - start, len(chunk))
+
+        start = time.perf_counter()
+        ml_anomalies["ml_explanation"] = detector.explain(features[rows])
+        timer.add("explain", time.perf_counter() - start, len(ml_anomalies))
+        ml_parts.append(ml_anomalies)
+
+    def train():
+        nonlocal detector
+        detector = MLDetector()
+        train = pd.concat(pending).iloc[:train_rows]
+        features = machine_rolling_features(train, {}, detector.windows, detector.ewma_spans)
+        complete = train[SENSORS].notna().all(axis=1).to_numpy()
+        detector.fit(train[complete], features[complete])
+
+    chunks = iter(chunks)
+    while True:
+        start = time.perf_counter()
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        timer.add("load", time.perf_counter() - start, len(chunk))
+        if chunk.empty:
+            continue
+        n_rows += len(chunk)
+        if max_gap is None:
+            sample_gap(chunk)
+
+        if sensor_cols is None:
+            sensor_cols = [chunk.columns.get_loc(s) for s in SENSORS]
+        start = time.perf_counter()
+        impute(chunk)
+        timer.add("impute", time.perf_counter() - start, len(chunk))
+
+        if detector is None:
+            # the training rows may span several chunks; --train_rows is not capped by --chunksize
+            pending.append(chunk)
+            pending_rows += len(chunk)
+            if pending_rows < train_rows:
+                continue
+            train()
+            ready, pending = pending, []
+        else:
+            ready = [chunk]
+        for c in ready:
+            score(c)
+
+    if max_gap is None:
+        sample_gap()
+    if pending:
+        # fewer readings than train_rows in total: train on all of them
+        train()
+        for c in pending:
+            score(c)
+
+    rule_anomalies = (pd.concat(rule_parts, ignore_index=True) if rule_parts
+                      else pd.DataFrame(columns=RULE_ANOMALY_COLUMNS))
+    ml_anomalies = (pd.concat(ml_parts, ignore_index=True) if ml_parts
+                    else pd.DataFrame(columns=["timestamp", *SENSORS, "ml_pred", "ml_score",
+                                               "ml_explanation"]))
+
+    start = time.perf_counter()
+    merged_alerts = build_combined_alerts(rule_anomalies, ml_anomalies)
+    timer.add("merge", time.perf_counter() - start, len(rule_anomalies) + len(ml_anomalies))
+
+    start = time.perf_counter()
+    # still None only if no machine ever reported twice: no two alerts of one
+    # machine can then be merged, whatever the gap
+    episodes = build_alert_episodes(merged_alerts, max_gap if max_gap is not None else pd.Timedelta(0))
+    timer.add("episodes", time.perf_counter() - start, len(merged_alerts))
+
+    return {
+        "rows": n_rows,
+        "detector": detector,
+        "rule_anomalies": rule_anomalies,
+        "ml_anomalies": ml_anomalies,
+        "merged_alerts": merged_alerts,
+        "episodes": episodes,
+        "missing_alerts": merge_missing_alerts(missing_parts),
+        "unscored_rows": unscored_rows,
+        "timer": timer,
+    }
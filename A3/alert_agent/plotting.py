@@ -0,0 +1,363 @@
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from .rules import SENSORS, sensor_excess
+
+# per-sensor plot styling, same labels and thresholds as the original notebook cells
+SENSOR_PLOTS = {
+    "temp": {
+        "label": "Temperature",
+        "title": "Temperature with Anomalies",
+        "ylabel": "Temp (°C)",
+        "rule_keyword": "Temperature",
+        "thresholds": [(43, "blue", "Lower Threshold (43°C)"), (52, "green", "Upper Threshold (52°C)")],
+    },
+    "pressure": {
+        "label": "Pressure",
+        "title": "Pressure with Anomalies",
+        "ylabel": "Pressure (bar)",
+        "rule_keyword": "Pressure",
+        "thresholds": [(1.08, "blue", "Upper Threshold (1.08)"), (0.97, "green", "Lower Threshold (0.97)")],
+    },
+    "vibration": {
+        "label": "Vibration",
+        "title": "Vibrations with Anomalies",
+        "ylabel": "Vibration",
+        "rule_keyword": "vibration",
+        "thresholds": [(0.07, "blue", "Upper Threshold (0.07)")],
+    },
+}
+
+MARKERS = [
+    ("ml_only", "red", "ML Only", 50, "o"),
+    ("rule_only", "orange", "Rule Only", 50, "D"),
+    ("both", "purple", "Both ML & Rule", 70, "X"),
+]
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: pick n_out indices that keep the visual
+    shape of (x, y). The first and last points are always kept.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # n_out - 2 buckets over the interior, the last point is its own bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    edges = np.append(edges, n)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x, edges[:-1]) / counts
+    avg_y = np.add.reduceat(y, edges[:-1]) / counts
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - avg_x[i + 1]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (avg_y[i + 1] - ay))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def minmax_indices(y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """Indices of the min and max of each of n_buckets equal-width buckets."""
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    size = -(-n // n_buckets)
+    padded = np.full(size * n_buckets, np.nan)
+    padded[:n] = y
+    rows = padded.reshape(n_buckets, size)
+    base = np.arange(n_buckets) * size
+    lo = base + np.where(np.isnan(rows), np.inf, rows).argmin(axis=1)
+    hi = base + np.where(np.isnan(rows), -np.inf, rows).argmax(axis=1)
+    idx = np.unique(np.concatenate([lo, hi]))
+    return idx[idx < n]
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int, method: str = "lttb",
+               keep: np.ndarray = None) -> np.ndarray:
+    """
+    Sorted indices of at most ~max_points representative points, always
+    including every index where `keep` is True (e.g. anomalies).
+    NaN readings are never selected.
+    """
+    y = np.asarray(y, dtype=float)
+    finite = np.flatnonzero(~np.isnan(y))
+    if len(finite) > max_points:
+        if method == "lttb":
+            picked = finite[lttb_indices(np.asarray(x, dtype=float)[finite], y[finite], max_points)]
+        elif method == "minmax":
+            picked = finite[minmax_indices(y[finite], max(1, max_points // 2))]
+        else:
+            raise ValueError(f"Unknown downsampling method: {method}")
+    else:
+        picked = finite
+    if keep is not None:
+        picked = np.union1d(picked, np.flatnonzero(keep & ~np.isnan(y)))
+    return picked
+
+
+def anomaly_masks(df: pd.DataFrame, rule_anomalies: pd.DataFrame, ml_anomalies: pd.DataFrame,
+                  sensors=SENSORS) -> dict:
+    """
+    Per-sensor (rule_mask, ml_mask) boolean arrays aligned with df, built with
+    one timestamp lookup per alert table instead of one isin() per sensor.
+    Duplicate timestamps in df resolve to their first row.
+    """
+    ts = pd.to_datetime(df["timestamp"]).to_numpy()
+    is_sorted = bool(np.all(ts[1:] >= ts[:-1]))
+    masks = {s: (np.zeros(len(df), dtype=bool), np.zeros(len(df), dtype=bool)) for s in sensors}
+
+    for table, text_col, ml in ((rule_anomalies, "alert_reasons", False),
+                                (ml_anomalies, "ml_explanation", True)):
+        if table is None or len(table) == 0 or text_col not in table:
+            continue
+        pos = _positions(ts, pd.to_datetime(table["timestamp"]).to_numpy(), is_sorted)
+        found = pos >= 0
+        text = table[text_col].fillna("").astype(str)
+        for s in sensors:
+            keyword = s if ml else SENSOR_PLOTS[s]["rule_keyword"]
+            hit = found & text.str.contains(keyword, regex=False).to_numpy()
+            masks[s][1 if ml else 0][pos[hit]] = True
+    return masks
+
+
+def _positions(ts: np.ndarray, lookup: np.ndarray, is_sorted: bool) -> np.ndarray:
+    """Row of each lookup timestamp in ts, -1 when absent."""
+    # binary search avoids hashing the whole (long, usually already sorted) history
+    order = None if is_sorted else np.argsort(ts, kind="stable")
+    sorted_ts = ts if order is None else ts[order]
+    pos = np.searchsorted(sorted_ts, lookup)
+    inside = pos < len(ts)
+    found = inside.copy()
+    found[inside] = sorted_ts[pos[inside]] == lookup[inside]
+    if order is not None:
+        pos = order[np.minimum(pos, len(ts) - 1)]
+    return np.where(found, pos, -1)
+
+
+def _marker_groups(rule_mask, ml_mask) -> dict:
+    return {
+        "ml_only": ml_mask & ~rule_mask,
+        "rule_only": rule_mask & ~ml_mask,
+        "both": ml_mask & rule_mask,
+    }
+
+
+def _style_axis(ax, sensor):
+    style = SENSOR_PLOTS[sensor]
+    for y, color, label in style["thresholds"]:
+        ax.axhline(y=y, color=color, linestyle="--", label=label)
+    ax.set_title(style["title"])
+    ax.set_xlabel("Timestamp")
+    ax.set_ylabel(style["ylabel"])
+    ax.legend(loc="upper right")
+    ax.tick_params(axis="x", labelrotation=45)
+
+
+def plot_sensor_anomalies(df: pd.DataFrame, rule_anomalies: pd.DataFrame, ml_anomalies: pd.DataFrame,
+                          max_points: int = 4000, method: str = "lttb", sensors=SENSORS):
+    """
+    Plot every sensor with its anomalies in one figure (one subplot per sensor).
+    Lines are downsampled to ~max_points per sensor; anomaly points are always drawn.
+    """
+    x = pd.to_datetime(df["timestamp"]).to_numpy()
+    x_num = x.astype("datetime64[ns]").astype(np.int64).astype(float)
+    masks = anomaly_masks(df, rule_anomalies, ml_anomalies, sensors)
+
+    fig, axes = plt.subplots(len(sensors), 1, figsize=(14, 5 * len(sensors)), squeeze=False)
+    for ax, s in zip(axes[:, 0], sensors):
+        y = df[s].to_numpy(dtype=float)
+        rule_mask, ml_mask = masks[s]
+        idx = downsample(x_num, y, max_points, method, keep=rule_mask | ml_mask)
+        ax.plot(x[idx], y[idx], label=SENSOR_PLOTS[s]["label"], alpha=0.7)
+        groups = _marker_groups(rule_mask, ml_mask)
+        for key, color, label, size, marker in MARKERS:
+            ax.scatter(x[groups[key]], y[groups[key]], color=color, label=label, s=size, marker=marker)
+        _style_axis(ax, s)
+    fig.tight_layout()
+    return fig
+
+
+class IncrementalMinMax:
+    """
+    Min/max-per-bucket summary of an append-only series. New points are
+    folded into buckets as they arrive; when there are more than max_buckets
+    the bucket width doubles by merging neighbours, so memory and redraw
+    cost stay bounded however long the feed runs.
+    """
+
+    def __init__(self, max_buckets: int = 2000):
+        if max_buckets < 2:
+            raise ValueError("max_buckets must be >= 2")
+        self.max_buckets = max_buckets
+        self.bucket_size = 1
+        # one row per bucket: x_min, y_min, x_max, y_max
+        self.buckets = np.empty((0, 4))
+        self.tail_x = np.empty(0)
+        self.tail_y = np.empty(0)
+
+    def extend(self, x, y):
+        x = np.concatenate([self.tail_x, np.asarray(x, dtype=float)])
+        y = np.concatenate([self.tail_y, np.asarray(y, dtype=float)])
+        n_full = len(x) // self.bucket_size
+        if n_full:
+            cut = n_full * self.bucket_size
+            self.buckets = np.vstack([self.buckets, self._summarise(x[:cut], y[:cut], self.bucket_size)])
+            x, y = x[cut:], y[cut:]
+        self.tail_x, self.tail_y = x, y
+        while len(self.buckets) > self.max_buckets:
+            self._merge_pairs()
+
+    @staticmethod
+    def _summarise(x, y, size):
+        xs = x.reshape(-1, size)
+        ys = y.reshape(-1, size)
+        rows = np.arange(len(xs))
+        lo = np.where(np.isnan(ys), np.inf, ys).argmin(axis=1)
+        hi = np.where(np.isnan(ys), -np.inf, ys).argmax(axis=1)
+        return np.column_stack([xs[rows, lo], ys[rows, lo], xs[rows, hi], ys[rows, hi]])
+
+    def _merge_pairs(self):
+        even = len(self.buckets) - len(self.buckets) % 2
+        a, b = self.buckets[0:even:2], self.buckets[1:even:2]
+        take_a_min = ~(b[:, 1] < a[:, 1])
+        take_a_max = ~(b[:, 3] > a[:, 3])
+        merged = np.column_stack([
+            np.where(take_a_min, a[:, 0], b[:, 0]), np.where(take_a_min, a[:, 1], b[:, 1]),
+            np.where(take_a_max, a[:, 2], b[:, 2]), np.where(take_a_max, a[:, 3], b[:, 3]),
+        ])
+        self.buckets = np.vstack([merged, self.buckets[even:]])
+        self.bucket_size *= 2
+
+    def points(self):
+        """(x, y) of the summary in time order; the unfinished tail counts as one more bucket."""
+        b = self.buckets
+        if len(self.tail_x):
+            size = len(self.tail_x)
+            b = np.vstack([b, self._summarise(self.tail_x, self.tail_y, size)])
+        first_is_min = b[:, 0] <= b[:, 2]
+        x = np.column_stack([np.where(first_is_min, b[:, 0], b[:, 2]),
+                             np.where(first_is_min, b[:, 2], b[:, 0])]).ravel()
+        y = np.column_stack([np.where(first_is_min, b[:, 1], b[:, 3]),
+                             np.where(first_is_min, b[:, 3], b[:, 1])]).ravel()
+        ok = np.isfinite(y)
+        return x[ok], y[ok]
+
+
+class AnomalyMarkers:
+    """
+    Bounded anomaly marker positions for a live feed, in time order. Points
+    are copied into preallocated arrays; when those are full, the time axis
+    is cut into buckets of doubling width and only the first marker of each
+    bucket is kept, so memory and scatter size stay capped.
+    """
+
+    def __init__(self, max_markers: int = 1000):
+        if max_markers < 1:
+            raise ValueError("max_markers must be >= 1")
+        self.max_markers = max_markers
+        self.x = np.empty(max_markers)
+        self.y = np.empty(max_markers)
+        self.n = 0
+        self.origin = None
+        self.bucket_width = 0.0
+
+    def _thin(self, x, y, after=None):
+        """First point per bucket, skipping the bucket of x value `after`."""
+        b = np.floor((x - self.origin) / self.bucket_width)
+        keep = np.r_[True, b[1:] != b[:-1]][:len(b)]
+        if after is not None:
+            keep &= b != np.floor((after - self.origin) / self.bucket_width)
+        return x[keep], y[keep]
+
+    def extend(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if not len(x):
+            return
+        if self.origin is None:
+            self.origin = x[0]
+        if self.bucket_width:
+            x, y = self._thin(x, y, self.x[self.n - 1] if self.n else None)
+        while self.n + len(x) > self.max_markers:
+            span = max(x[-1] - self.origin, np.finfo(float).tiny)
+            self.bucket_width = max(2 * self.bucket_width, span / self.max_markers)
+            kept_x, kept_y = self._thin(self.x[:self.n], self.y[:self.n])
+            self.n = len(kept_x)
+            self.x[:self.n], self.y[:self.n] = kept_x, kept_y
+            x, y = self._thin(x, y, self.x[self.n - 1] if self.n else None)
+        self.x[self.n:self.n + len(x)] = x
+        self.y[self.n:self.n + len(y)] = y
+        self.n += len(x)
+
+    def offsets(self) -> np.ndarray:
+        """(n, 2) marker positions for PathCollection.set_offsets."""
+        return np.column_stack([self.x[:self.n], self.y[:self.n]])
+
+
+class LiveSensorPlot:
+    """
+    Figure for a live feed. update() appends a chunk of readings and redraws;
+    only the bounded min/max summary and at most max_markers anomaly
+    markers per sensor and marker group are kept and handed to matplotlib,
+    never the full history.
+    """
+
+    def __init__(self, sensors=SENSORS, max_points: int = 4000, max_markers: int = 1000):
+        self.sensors = list(sensors)
+        self.summaries = {s: IncrementalMinMax(max(2, max_points // 2)) for s in self.sensors}
+        self.markers = {s: {key: AnomalyMarkers(max_markers) for key, *_ in MARKERS}
+                        for s in self.sensors}
+        self.fig, axes = plt.subplots(len(self.sensors), 1, figsize=(14, 5 * len(self.sensors)),
+                                      squeeze=False)
+        self.axes = dict(zip(self.sensors, axes[:, 0]))
+        self.lines = {}
+        self.scatters = {}
+        for s, ax in self.axes.items():
+            (self.lines[s],) = ax.plot([], [], label=SENSOR_PLOTS[s]["label"], alpha=0.7)
+            self.scatters[s] = {
+                key: ax.scatter([], [], color=color, label=label, s=size, marker=marker)
+                for key, color, label, size, marker in MARKERS
+            }
+            ax.xaxis_date()
+            _style_axis(ax, s)
+
+    def update(self, chunk: pd.DataFrame, masks: dict = None):
+        """
+        chunk: new readings with timestamp and sensor columns.
+        masks: optional {sensor: (rule_mask, ml_mask)} for the chunk, as from
+               anomaly_masks(); defaults to the strict rule thresholds only.
+        """
+        x = mdates.date2num(pd.to_datetime(chunk["timestamp"]).to_numpy())
+        for s in self.sensors:
+            y = chunk[s].to_numpy(dtype=float)
+            if masks is not None:
+                rule_mask, ml_mask = masks[s]
+            else:
+                rule_mask, ml_mask = sensor_excess(y, s) > 0, np.zeros(len(y), dtype=bool)
+
+            summary = self.summaries[s]
+            summary.extend(x, y)
+            self.lines[s].set_data(*summary.points())
+
+            for key, mask in _marker_groups(rule_mask, ml_mask).items():
+                if mask.any():
+                    markers = self.markers[s][key]
+                    markers.extend(x[mask], y[mask])
+                    self.scatters[s][key].set_offsets(markers.offsets())
+
+            ax = self.axes[s]
+            ax.relim()
+            ax.autoscale_view()
+        self.fig.canvas.draw_idle()
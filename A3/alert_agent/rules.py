@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+SENSORS = ["temp", "pressure", "vibration"]
+
+# (lower, upper) strict thresholds; None means the side is unbounded
+SENSOR_LIMITS = {
+    "temp": (43.0, 52.0),
+    "pressure": (0.97, 1.08),
+    "vibration": (None, 0.07),
+}
+
+# multiplier applied to the distance beyond a limit, same as anomaly_score
+SENSOR_WEIGHTS = {
+    "temp": 1.0,
+    "pressure": 10.0,
+    "vibration": 100.0,
+}
+
+SENSOR_REASONS = {
+    "temp": "Temperature out of range",
+    "pressure": "Pressure out of range",
+    "vibration": "High vibration",
+}
+
+
+def sensor_excess(values, sensor: str) -> np.ndarray:
+    """
+    Weighted distance beyond the strict thresholds for one sensor column.
+    Readings inside the range (and NaN) score 0.
+    """
+    values = np.asarray(values, dtype=float)
+    lower, upper = SENSOR_LIMITS[sensor]
+    excess = np.zeros(values.shape)
+    if upper is not None:
+        excess = np.where(values > upper, values - upper, excess)
+    if lower is not None:
+        excess = np.where(values < lower, lower - values, excess)
+    return excess * SENSOR_WEIGHTS[sensor]
+
+
+def anomaly_score(temp, pressure, vibration):
+    score = 0.0
+
+    if temp > 52:
+        score += (temp - 52)
+    elif temp < 43:
+        score += (43 - temp)
+
+    if pressure > 1.08:
+        score += (pressure - 1.08) * 10
+    elif pressure < 0.97:
+        score += (0.97 - pressure) * 10
+
+    if vibration > 0.07:
+        score += (vibration - 0.07) * 100
+
+    return round(score, 4)
+
+
+def detect_anomalies(row):
+    reasons = []
+    if row["temp"] > 52 or row["temp"] < 43:
+        reasons.append(f"Temperature out of range ({row['temp']}°C)")
+    if row["pressure"] > 1.08 or row["pressure"] < 0.97:
+        reasons.append(f"Pressure out of range ({row['pressure']} bar)")
+    if row["vibration"] > 0.07:
+        reasons.append(f"High vibration ({row['vibration']})")
+    return reasons
+
+
+RULE_ANOMALY_COLUMNS = ["timestamp", "temp", "pressure", "vibration", "score", "alert_reasons"]
+
+# optional column identifying the machine a reading came from
+MACHINE_COL = "machine_id"
+
+
+def detect_rule_anomalies(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Vectorized equivalent of running detect_anomalies/anomaly_score over
+    every row: one row per reading that breaks at least one threshold.
+    A machine_id column, when present, is kept in front.
+    """
+    excess = {s: sensor_excess(df[s], s) for s in SENSORS}
+    hit = np.any([excess[s] > 0 for s in SENSORS], axis=0)
+    rows = np.flatnonzero(hit)
+
+    machine = [MACHINE_COL] if MACHINE_COL in df else []
+    alerts = df.iloc[rows][machine + ["timestamp", "temp", "pressure", "vibration"]].copy()
+    alerts["score"] = np.round(sum(excess[s][rows] for s in SENSORS), 4)
+    # reason strings are only built for the (few) anomalous rows
+    alerts["alert_reasons"] = [
+        "; ".join(detect_anomalies({"temp": t, "pressure": p, "vibration": v}))
+        for t, p, v in zip(alerts["temp"].tolist(), alerts["pressure"].tolist(),
+                           alerts["vibration"].tolist())
+    ]
+    return alerts[machine + RULE_ANOMALY_COLUMNS].reset_index(drop=True)
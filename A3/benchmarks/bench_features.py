@@ -0,0 +1,64 @@
+"""
+Per-reading update cost of StreamingFeatureEngine on long streams.
+
+Run from the A3 directory:
+    python3 benchmarks/bench_features.py --n_readings 1000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.features import StreamingFeatureEngine, rolling_features
+from alert_agent.rules import SENSORS
+
+
+def make_stream(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "temp": 47.5 + rng.normal(0, 0.5, n).cumsum() * 0.01,
+        "pressure": rng.uniform(1.00, 1.05, n),
+        "vibration": rng.uniform(0.02, 0.04, n),
+    })
+
+
+def bench_streaming(df: pd.DataFrame, windows) -> float:
+    """Seconds per reading for update() over the whole stream."""
+    engine = StreamingFeatureEngine(windows=windows)
+    readings = df[SENSORS].to_dict("records")
+    start = time.perf_counter()
+    for reading in readings:
+        engine.update(reading)
+    return (time.perf_counter() - start) / len(readings)
+
+
+def bench_batch(df: pd.DataFrame, windows) -> float:
+    start = time.perf_counter()
+    rolling_features(df, windows=windows)
+    return (time.perf_counter() - start) / len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rolling feature engine benchmark")
+    parser.add_argument("--n_readings", type=int, default=1_000_000,
+                        help="Length of the simulated stream")
+    parser.add_argument("--windows", type=int, nargs="+", default=[5, 20, 100, 1000],
+                        help="Window sizes to benchmark (one run per size)")
+    args = parser.parse_args()
+
+    df = make_stream(args.n_readings)
+    print(f"Stream length: {args.n_readings} readings, {len(SENSORS)} sensors")
+    print(f"{'window':>8} | {'streaming us/reading':>21} | {'batch us/reading':>17}")
+    for w in args.windows:
+        stream_cost = bench_streaming(df, (w,))
+        batch_cost = bench_batch(df, (w,))
+        print(f"{w:>8} | {stream_cost * 1e6:>21.3f} | {batch_cost * 1e6:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Throughput of SensorImputer at high missing rates, batch and chunked,
+against the pandas equivalents (ffill / interpolate with a limit).
+
+Run from the A3 directory:
+    python3 benchmarks/bench_imputation.py --n_readings 1000000 --missing_rates 0.1 0.3 0.5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.imputation import METHODS, SensorImputer
+from alert_agent.rules import SENSORS
+
+
+def make_readings(n: int, missing_rate: float, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-07 01:00", periods=n, freq="1min"),
+        "temp": rng.uniform(45.0, 50.0, n),
+        "pressure": rng.uniform(1.00, 1.05, n),
+        "vibration": rng.uniform(0.02, 0.04, n),
+    })
+    for s in SENSORS:
+        df.loc[rng.random(n) < missing_rate, s] = np.nan
+    return df
+
+
+def bench_imputer(df: pd.DataFrame, method: str, max_gap: int, chunksize: int = None) -> float:
+    """Rows per second of SensorImputer.transform over df (copied beforehand)."""
+    imputer = SensorImputer({s: {"method": method, "max_gap": max_gap} for s in SENSORS})
+    chunksize = chunksize or len(df)
+    chunks = [df.iloc[k:k + chunksize].copy() for k in range(0, len(df), chunksize)]
+    start = time.perf_counter()
+    for chunk in chunks:
+        imputer.transform(chunk)
+    return len(df) / (time.perf_counter() - start)
+
+
+def bench_pandas(df: pd.DataFrame, method: str, max_gap: int) -> float:
+    if method == "hold_last_good":
+        return float("nan")
+    start = time.perf_counter()
+    if method == "ffill":
+        df[SENSORS].ffill(limit=max_gap)
+    else:
+        df[SENSORS].interpolate(limit=max_gap, limit_area="inside")
+    return len(df) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Missing-value imputation benchmark")
+    parser.add_argument("--n_readings", type=int, default=1_000_000)
+    parser.add_argument("--missing_rates", type=float, nargs="+", default=[0.1, 0.3, 0.5])
+    parser.add_argument("--max_gap", type=int, default=3)
+    parser.add_argument("--chunksize", type=int, default=10_000,
+                        help="Chunk size of the streaming run")
+    args = parser.parse_args()
+
+    print(f"{args.n_readings} readings, {len(SENSORS)} sensors, max_gap={args.max_gap}, "
+          f"streaming chunks of {args.chunksize}")
+    print(f"{'missing':>7} | {'method':>14} | {'batch rows/s':>13} | {'chunked rows/s':>14} | "
+          f"{'pandas rows/s':>13}")
+    for rate in args.missing_rates:
+        df = make_readings(args.n_readings, rate)
+        for method in METHODS:
+            batch = bench_imputer(df, method, args.max_gap)
+            chunked = bench_imputer(df, method, args.max_gap, args.chunksize)
+            baseline = bench_pandas(df, method, args.max_gap)
+            baseline = f"{baseline:>13.0f}" if np.isfinite(baseline) else f"{'-':>13}"
+            print(f"{rate:>7.0%} | {method:>14} | {batch:>13.0f} | {chunked:>14.0f} | {baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Per-stage throughput of the alert-agent pipeline across input sizes.
+
+Run from the A3 directory:
+    python3 benchmarks/bench_pipeline.py --sizes 10000 100000 1000000 --format parquet
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.data import iter_frame_chunks, read_sensor_chunks
+from alert_agent.pipeline import STAGES, StageTimer, run_pipeline
+from alert_agent.rules import SENSORS, sensor_excess
+
+
+def make_readings(n: int, anomaly_rate: float = 0.02, missing_rate: float = 0.01, seed: int = 0):
+    """Vectorized stand-in for generate_dummy_data at benchmark sizes."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-07 01:00", periods=n, freq="1min"),
+        "temp": rng.uniform(45.0, 50.0, n).round(3),
+        "pressure": rng.uniform(1.00, 1.05, n).round(3),
+        "vibration": rng.uniform(0.02, 0.04, n).round(3),
+    })
+    hits = rng.random(n) < anomaly_rate
+    df.loc[hits & (rng.random(n) < 0.5), "temp"] = 60.0
+    df.loc[hits & (rng.random(n) < 0.5), "pressure"] = 1.2
+    df.loc[hits & (rng.random(n) < 0.5), "vibration"] = 0.15
+    abnormal = np.any([sensor_excess(df[s], s) > 0 for s in SENSORS], axis=0)
+    df["label"] = np.where(abnormal, "abnormal", "normal")
+    for s in SENSORS:
+        df.loc[rng.random(n) < missing_rate, s] = np.nan
+    return df
+
+
+def run_once(df, fmt, chunksize, train_rows, tmpdir) -> StageTimer:
+    if fmt == "memory":
+        chunks = iter_frame_chunks(df, chunksize)
+    else:
+        path = Path(tmpdir) / f"readings_{len(df)}.{fmt}"
+        if not path.exists():
+            if fmt == "csv":
+                df.to_csv(path, index=False)
+            else:
+                df.to_parquet(path, index=False)
+        chunks = read_sensor_chunks(path, chunksize=chunksize)
+    return run_pipeline(chunks, train_rows=train_rows)["timer"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alert agent pipeline benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Input sizes (rows)")
+    parser.add_argument("--format", choices=["memory", "csv", "parquet"], default="memory",
+                        help="Where the chunks are read from")
+    parser.add_argument("--chunksize", type=int, default=100_000,
+                        help="Rows per chunk")
+    parser.add_argument("--train_rows", type=int, default=500,
+                        help="Rows used to train the RandomForest")
+    args = parser.parse_args()
+
+    rates = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in args.sizes:
+            report = run_once(make_readings(n), args.format, args.chunksize,
+                              args.train_rows, tmpdir).report().set_index("stage")
+            rates[n] = report
+            print(f"{n} rows: {report['seconds'].sum():.3f} s total")
+
+    print(f"\nThroughput (rows/sec) per stage, format={args.format}, chunksize={args.chunksize}")
+    print(f"{'stage':<10} | " + " | ".join(f"{n:>12}" for n in args.sizes))
+    print("-" * (13 + 15 * len(args.sizes)))
+    for stage in STAGES:
+        cells = []
+        for n in args.sizes:
+            rate = rates[n]["rows_per_sec"].get(stage, np.nan)
+            cells.append(f"{rate:>12.0f}" if pd.notna(rate) else f"{'-':>12}")
+        print(f"{stage:<10} | " + " | ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Render time of the sensor plots at 1M and 10M points.
+
+Compares the raw three-cell approach (every point passed to plt.plot) with
+plot_sensor_anomalies (LTTB / min-max downsampling) and LiveSensorPlot
+redraws. Run from the A3 directory:
+    python3 benchmarks/bench_plotting.py --sizes 1000000 10000000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.plotting import LiveSensorPlot, anomaly_masks, plot_sensor_anomalies
+from alert_agent.rules import SENSORS, SENSOR_REASONS, sensor_excess
+
+
+def make_history(n: int, anomaly_rate: float = 0.001, seed: int = 0):
+    """Sensor frame plus rule/ML alert tables shaped like the notebook's."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-07 01:00", periods=n, freq="1s"),
+        "temp": rng.uniform(45.0, 50.0, n),
+        "pressure": rng.uniform(1.00, 1.05, n),
+        "vibration": rng.uniform(0.02, 0.04, n),
+    })
+    hits = rng.random(n) < anomaly_rate
+    df.loc[hits, "temp"] = rng.uniform(52.5, 70.0, hits.sum())
+
+    rows = np.flatnonzero(sensor_excess(df["temp"], "temp") > 0)
+    rule_anomalies = pd.DataFrame({
+        "timestamp": df["timestamp"].to_numpy()[rows],
+        "alert_reasons": SENSOR_REASONS["temp"],
+    })
+    ml_rows = rows[::2]
+    ml_anomalies = pd.DataFrame({
+        "timestamp": df["timestamp"].to_numpy()[ml_rows],
+        "ml_explanation": "temp",
+    })
+    return df, rule_anomalies, ml_anomalies
+
+
+def time_draw(fig) -> float:
+    start = time.perf_counter()
+    fig.canvas.draw()
+    return time.perf_counter() - start
+
+
+def bench_raw(df, rule_anomalies, ml_anomalies):
+    """The original per-sensor cells: full-resolution plot, masks rebuilt per sensor."""
+    start = time.perf_counter()
+    figs = []
+    for s in SENSORS:
+        keyword = {"temp": "Temperature", "pressure": "Pressure", "vibration": "vibration"}[s]
+        rule_mask = df["timestamp"].isin(
+            rule_anomalies.loc[rule_anomalies["alert_reasons"].str.contains(keyword), "timestamp"])
+        ml_mask = df["timestamp"].isin(
+            ml_anomalies.loc[ml_anomalies["ml_explanation"].str.contains(s), "timestamp"])
+        fig = plt.figure(figsize=(14, 5))
+        plt.plot(df["timestamp"], df[s], alpha=0.7)
+        plt.scatter(df["timestamp"][rule_mask | ml_mask], df[s][rule_mask | ml_mask], s=50)
+        fig.canvas.draw()
+        figs.append(fig)
+    elapsed = time.perf_counter() - start
+    for fig in figs:
+        plt.close(fig)
+    return elapsed
+
+
+def bench_downsampled(df, rule_anomalies, ml_anomalies, method, max_points):
+    start = time.perf_counter()
+    fig = plot_sensor_anomalies(df, rule_anomalies, ml_anomalies, max_points=max_points, method=method)
+    fig.canvas.draw()
+    elapsed = time.perf_counter() - start
+    plt.close(fig)
+    return elapsed
+
+
+def bench_live(df, rule_anomalies, ml_anomalies, chunk_size, max_points):
+    """Mean seconds per update()+draw when the history arrives in chunks."""
+    live = LiveSensorPlot(max_points=max_points)
+    masks = anomaly_masks(df, rule_anomalies, ml_anomalies)
+    costs = []
+    for lo in range(0, len(df), chunk_size):
+        hi = lo + chunk_size
+        chunk_masks = {s: (r[lo:hi], m[lo:hi]) for s, (r, m) in masks.items()}
+        start = time.perf_counter()
+        live.update(df.iloc[lo:hi], chunk_masks)
+        live.fig.canvas.draw()
+        costs.append(time.perf_counter() - start)
+    plt.close(live.fig)
+    return float(np.mean(costs)), costs[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sensor plot render benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 10_000_000],
+                        help="Number of readings per run")
+    parser.add_argument("--max_points", type=int, default=4000,
+                        help="Downsampling budget per sensor")
+    parser.add_argument("--chunk_size", type=int, default=100_000,
+                        help="Readings per live update")
+    parser.add_argument("--raw_limit", type=int, default=1_000_000,
+                        help="Skip the raw full-resolution plot above this size")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        df, rule_anomalies, ml_anomalies = make_history(n)
+        print(f"\n{n} readings, {len(rule_anomalies)} rule / {len(ml_anomalies)} ML alerts")
+        if n <= args.raw_limit:
+            print(f"  raw (3 cells)        : {bench_raw(df, rule_anomalies, ml_anomalies):8.3f} s")
+        else:
+            print(f"  raw (3 cells)        :  skipped (> --raw_limit)")
+        for method in ("lttb", "minmax"):
+            t = bench_downsampled(df, rule_anomalies, ml_anomalies, method, args.max_points)
+            print(f"  {method:<6} (one figure)  : {t:8.3f} s")
+        mean_cost, last_cost = bench_live(df, rule_anomalies, ml_anomalies, args.chunk_size, args.max_points)
+        print(f"  live redraw / chunk  : {mean_cost:8.3f} s mean, {last_cost:.3f} s last")
+
+
+if __name__ == "__main__":
+    main()
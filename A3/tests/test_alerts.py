@@ -0,0 +1,78 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.alerts import build_combined_alerts, combined_alerts
+
+
+class TestBuildCombinedAlerts(unittest.TestCase):
+    """Test suite for build_combined_alerts function"""
+
+    def setUp(self):
+        ts = pd.date_range("2025-01-07 01:00", periods=3, freq="5min")
+        self.rule = pd.DataFrame({
+            "timestamp": ts[:2],
+            "temp": [55.0, 60.0], "pressure": [1.02, 1.02], "vibration": [0.03, 0.03],
+            "score": [3.0, 8.0],
+            "alert_reasons": ["Temperature out of range (55.0°C)", "Temperature out of range (60.0°C)"],
+        })
+        self.ml = pd.DataFrame({
+            "timestamp": ts[1:],
+            "temp": [60.0, 48.0], "pressure": [1.02, 1.02], "vibration": [0.03, 0.06],
+            "ml_pred": [1, 1], "ml_score": [0.9, 0.7],
+            "ml_explanation": ["temp", "vibration"],
+        })
+
+    def test_outer_merge_on_timestamp(self):
+        merged = build_combined_alerts(self.rule, self.ml)
+
+        self.assertEqual(len(merged), 3)
+        self.assertEqual(list(merged["rule"]), [True, True, False])
+        self.assertEqual(list(merged["ml"]), [False, True, True])
+        np.testing.assert_allclose(merged["rule_score"].iloc[:2], [0.0, 1.0])
+        self.assertEqual(merged["vibration"].iloc[2], 0.06)
+        self.assertEqual(merged["alert_reasons"].iloc[2], "")
+
+    def test_machines_sharing_a_timestamp_stay_separate(self):
+        rule = self.rule.assign(machine_id=["press-1", "press-2"])
+        ml = self.ml.assign(machine_id=["press-1", "press-2"])
+        merged = build_combined_alerts(rule, ml)
+
+        # press-2 @ ts[1] (rule) and press-1 @ ts[1] (ML) are different readings
+        self.assertEqual(len(merged), 4)
+        self.assertEqual(list(merged.columns[:2]), ["machine_id", "timestamp"])
+        row = merged[(merged["machine_id"] == "press-1") & (merged["timestamp"] == self.ml["timestamp"][0])]
+        self.assertEqual((row["rule"].item(), row["ml"].item()), (False, True))
+
+    def test_machine_column_on_one_side_only(self):
+        merged = build_combined_alerts(self.rule.assign(machine_id="press-1"), self.ml.iloc[:0])
+        self.assertEqual(list(merged["machine_id"]), ["press-1", "press-1"])
+        with self.assertRaises(ValueError):
+            build_combined_alerts(self.rule.assign(machine_id="press-1"), self.ml)
+
+    def test_inputs_not_modified(self):
+        build_combined_alerts(self.rule, self.ml)
+        self.assertNotIn("rule_score", self.rule.columns)
+
+    def test_single_rule_alert_normalizes_to_zero(self):
+        merged = build_combined_alerts(self.rule.iloc[:1], self.ml.iloc[:0])
+        self.assertEqual(merged["rule_score"].iloc[0], 0.0)
+
+    @patch("builtins.print")
+    def test_combined_alerts_output(self, mock_print):
+        combined_alerts(build_combined_alerts(self.rule, self.ml))
+
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("Total anomalies: 3", printed)
+        self.assertIn("ALERT (Both Rule-based and ML-based)", printed)
+        self.assertIn("ML Suggestion: Abnormal vibration", printed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import builtins
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent import cli
+from alert_agent.data import generate_dummy_data
+
+
+class TestCli(unittest.TestCase):
+    """Test suite for the alert agent command line"""
+
+    def test_generated_data_run(self):
+        with patch.object(builtins, "print") as mock_print:
+            result = cli.main(["--n_rows", "120", "--chunksize", "50", "--show", "none"])
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertEqual(result["rows"], 120)
+        self.assertIn("Processed 120 rows", printed)
+        self.assertIn("features", printed)
+
+    def test_missing_sensor_alerts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "readings.csv")
+            df = generate_dummy_data(n_rows=120, interval_minutes=5)
+            df.loc[60:69, "temp"] = None
+            df.to_csv(path, index=False)
+
+            with patch.object(builtins, "print") as mock_print:
+                result = cli.main(["--input", path, "--chunksize", "50", "--impute", "interpolate",
+                                   "--impute_max_gap", "2"])
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertEqual(result["missing_alerts"]["n_missing"].tolist(), [8])
+        self.assertIn("Sensor missing (temp)", printed)
+
+    def test_csv_input_and_alerts_out(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "readings.csv")
+            out = os.path.join(tmp, "episodes.jsonl")
+            generate_dummy_data(n_rows=200, interval_minutes=5, anomaly_rate=0.3).to_csv(path, index=False)
+
+            with patch.object(builtins, "print"):
+                result = cli.main(["--input", path, "--chunksize", "64", "--max_gap", "5min",
+                                   "--alerts_out", out, "--show", "episodes",
+                                   "--notify_rate", "1000"])
+
+            with open(out, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), len(result["episodes"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.data import generate_dummy_data, iter_frame_chunks, read_sensor_chunks
+
+
+class TestGenerateDummyData(unittest.TestCase):
+    """Test suite for generate_dummy_data function"""
+
+    def test_columns_and_length(self):
+        df = generate_dummy_data(n_rows=40, interval_minutes=5)
+        self.assertEqual(list(df.columns), ["timestamp", "temp", "pressure", "vibration", "label"])
+        self.assertEqual(len(df), 40)
+        self.assertEqual(df["timestamp"].diff().iloc[1], pd.Timedelta(minutes=5))
+
+    def test_labels_follow_thresholds(self):
+        df = generate_dummy_data(n_rows=300, anomaly_rate=0.3)
+        abnormal = ((df["temp"] > 52) | (df["temp"] < 43) | (df["pressure"] > 1.08)
+                    | (df["pressure"] < 0.97) | (df["vibration"] > 0.07))
+        self.assertTrue(((df["label"] == "abnormal") == abnormal).all())
+
+    def test_missing_values(self):
+        df = generate_dummy_data(n_rows=200, introduce_missing=True, missing_rate=0.05)
+        self.assertGreater(df[["temp", "pressure", "vibration"]].isna().sum().sum(), 0)
+
+
+class TestChunkReaders(unittest.TestCase):
+    """Test suite for chunked CSV/Parquet readers"""
+
+    def setUp(self):
+        self.df = generate_dummy_data(n_rows=25)
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_iter_frame_chunks(self):
+        sizes = [len(c) for c in iter_frame_chunks(self.df, 10)]
+        self.assertEqual(sizes, [10, 10, 5])
+
+    def test_read_csv_chunks(self):
+        path = os.path.join(self.tmp.name, "readings.csv")
+        self.df.to_csv(path, index=False)
+
+        chunks = list(read_sensor_chunks(path, chunksize=10))
+
+        self.assertEqual([len(c) for c in chunks], [10, 10, 5])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(chunks[0]["timestamp"]))
+        np.testing.assert_allclose(pd.concat(chunks)["temp"], self.df["temp"])
+
+    def test_read_parquet_chunks(self):
+        path = os.path.join(self.tmp.name, "readings.parquet")
+        try:
+            self.df.to_parquet(path, index=False)
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+
+        chunks = list(read_sensor_chunks(path, chunksize=10))
+
+        self.assertEqual(sum(len(c) for c in chunks), 25)
+        self.assertEqual(chunks[1].index[0], 10)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            list(read_sensor_chunks(os.path.join(self.tmp.name, "readings.xlsx")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.episodes import build_alert_episodes, print_episodes, EPISODE_COLUMNS
+
+
+def make_alerts(rows):
+    return pd.DataFrame(rows, columns=[
+        "timestamp", "temp", "pressure", "vibration", "ml", "ml_score", "ml_explanation"])
+
+
+class TestBuildAlertEpisodes(unittest.TestCase):
+    """Test suite for build_alert_episodes function"""
+
+    def test_consecutive_readings_merge_into_one_episode(self):
+        """A sensor stuck out of range for many readings yields one episode"""
+        ts = pd.date_range("2025-01-07 01:00", periods=3600, freq="1s")
+        alerts = pd.DataFrame({
+            "timestamp": ts,
+            "temp": np.linspace(53.0, 60.0, len(ts)),
+            "pressure": 1.02,
+            "vibration": 0.03,
+        })
+
+        episodes = build_alert_episodes(alerts, max_gap="1s")
+
+        self.assertEqual(len(episodes), 1)
+        ep = episodes.iloc[0]
+        self.assertEqual(ep["sensor"], "temp")
+        self.assertEqual(ep["start"], ts[0])
+        self.assertEqual(ep["end"], ts[-1])
+        self.assertEqual(ep["n_alerts"], 3600)
+        self.assertAlmostEqual(ep["peak_rule_score"], 8.0)
+        self.assertEqual(ep["source"], "Rule-based")
+
+    def test_gap_splits_episodes(self):
+        """Alerts further apart than max_gap start a new episode"""
+        alerts = make_alerts([
+            ["2025-01-07 01:00", 55.0, 1.02, 0.03, False, np.nan, ""],
+            ["2025-01-07 01:05", 56.0, 1.02, 0.03, False, np.nan, ""],
+            ["2025-01-07 01:20", 57.0, 1.02, 0.03, False, np.nan, ""],
+        ])
+
+        episodes = build_alert_episodes(alerts, max_gap="5min")
+
+        self.assertEqual(list(episodes["n_alerts"]), [2, 1])
+
+    def test_sensors_and_machines_are_separate_streams(self):
+        """Each machine/sensor pair gets its own episodes"""
+        alerts = make_alerts([
+            ["2025-01-07 01:00", 55.0, 1.20, 0.03, False, np.nan, ""],
+            ["2025-01-07 01:05", 55.0, 1.02, 0.03, False, np.nan, ""],
+        ])
+        alerts["machine_id"] = ["m1", "m2"]
+
+        episodes = build_alert_episodes(alerts, max_gap="5min")
+
+        self.assertEqual(
+            sorted(zip(episodes["machine_id"], episodes["sensor"])),
+            [("m1", "pressure"), ("m1", "temp"), ("m2", "temp")])
+
+    def test_ml_explanation_attribution(self):
+        """ML alerts are charged to the sensors named in the explanation"""
+        alerts = make_alerts([
+            ["2025-01-07 01:00", 55.0, 1.02, 0.03, True, 0.9, "temp"],
+            ["2025-01-07 01:05", 48.0, 1.02, 0.06, True, 0.7, "vibration"],
+        ])
+
+        episodes = build_alert_episodes(alerts, max_gap="1min")
+
+        by_sensor = episodes.set_index("sensor")
+        self.assertEqual(by_sensor.loc["temp", "source"], "Both")
+        self.assertAlmostEqual(by_sensor.loc["temp", "peak_ml_score"], 0.9)
+        self.assertEqual(by_sensor.loc["vibration", "source"], "ML-based")
+        self.assertIn("ML flagged vibration", by_sensor.loc["vibration", "reasons"])
+
+    def test_rule_reason_range_skips_ml_only_readings(self):
+        """The min/max in the rule reason only cover out-of-range readings"""
+        alerts = make_alerts([
+            ["2025-01-07 01:00", 48.0, 1.02, 0.039, True, 0.8, "vibration"],
+            ["2025-01-07 01:05", 48.0, 1.02, 0.126, True, 0.9, "vibration"],
+        ])
+
+        episodes = build_alert_episodes(alerts, max_gap="5min")
+
+        self.assertEqual(len(episodes), 1)
+        self.assertIn("High vibration x1 (min 0.126, max 0.126)", episodes.iloc[0]["reasons"])
+
+    def test_unclear_ml_alert(self):
+        """ML alerts with no attributable sensor are kept as unattributed"""
+        alerts = make_alerts([
+            ["2025-01-07 01:00", 48.0, 1.02, 0.03, True, 0.6, "Unclear"],
+        ])
+
+        episodes = build_alert_episodes(alerts, max_gap="1min")
+
+        self.assertEqual(list(episodes["sensor"]), ["unattributed"])
+
+    def test_empty_input(self):
+        """Empty alerts return an empty frame with the episode columns"""
+        episodes = build_alert_episodes(make_alerts([]), max_gap="1min")
+        self.assertTrue(episodes.empty)
+        self.assertEqual(list(episodes.columns), EPISODE_COLUMNS)
+
+    @patch("builtins.print")
+    def test_print_episodes(self, mock_print):
+        """One block is printed per episode"""
+        alerts = make_alerts([
+            ["2025-01-07 01:00", 55.0, 1.02, 0.03, False, np.nan, ""],
+            ["2025-01-07 01:01", 55.0, 1.02, 0.03, False, np.nan, ""],
+        ])
+        print_episodes(build_alert_episodes(alerts, max_gap="1min"))
+
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("Total episodes: 1 | Alerts merged: 2", printed)
+        self.assertIn("Temperature out of range x2", printed)
+
+
+if __name__ == "__main__":
+    unittest.main()
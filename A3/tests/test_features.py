@@ -0,0 +1,112 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.features import (
+    ChunkedRollingFeatures, RingWindow, StreamingFeatureEngine, feature_names, rolling_features)
+
+
+class TestRingWindow(unittest.TestCase):
+    """Test suite for RingWindow running statistics"""
+
+    def test_matches_numpy_over_sliding_window(self):
+        """mean/std/slope equal a direct computation over the last N values"""
+        rng = np.random.default_rng(1)
+        values = rng.normal(50, 2, 200)
+        ring = RingWindow(7)
+        for k, v in enumerate(values):
+            ring.push(float(v))
+            window = values[max(0, k - 6):k + 1]
+            self.assertAlmostEqual(ring.mean(), window.mean(), places=9)
+            self.assertAlmostEqual(ring.std(), window.std(), places=9)
+            if len(window) > 1:
+                expected = np.polyfit(np.arange(len(window)), window, 1)[0]
+                self.assertAlmostEqual(ring.slope(), expected, places=9)
+
+    def test_linear_trend_slope(self):
+        """A steady drift of 0.5 per reading has slope 0.5"""
+        ring = RingWindow(10)
+        for k in range(25):
+            ring.push(40.0 + 0.5 * k)
+        self.assertAlmostEqual(ring.slope(), 0.5)
+        self.assertEqual(ring.values(), [40.0 + 0.5 * k for k in range(15, 25)])
+
+    def test_empty_and_single_value(self):
+        ring = RingWindow(3)
+        self.assertTrue(np.isnan(ring.mean()))
+        ring.push(2.0)
+        self.assertEqual(ring.slope(), 0.0)
+        self.assertEqual(ring.std(), 0.0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            RingWindow(0)
+
+
+class TestStreamingFeatureEngine(unittest.TestCase):
+    """Test suite for streaming vs. batch rolling features"""
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        n = 300
+        self.df = pd.DataFrame({
+            "temp": 47 + rng.normal(0, 0.2, n).cumsum(),
+            "pressure": rng.uniform(1.0, 1.05, n),
+            "vibration": rng.uniform(0.02, 0.04, n),
+        })
+        self.df.loc[:2, "temp"] = np.nan
+        self.df.loc[100:105, "pressure"] = np.nan
+
+    def test_streaming_matches_batch(self):
+        """Row-by-row updates reproduce the vectorized batch features"""
+        batch = rolling_features(self.df, windows=(4, 16), ewma_spans=(5, 30))
+        stream = StreamingFeatureEngine(windows=(4, 16), ewma_spans=(5, 30)).transform(self.df)
+
+        self.assertEqual(list(batch.columns), list(stream.columns))
+        np.testing.assert_allclose(stream.to_numpy(), batch.to_numpy(),
+                                   rtol=1e-7, atol=1e-9, equal_nan=True)
+
+    def test_chunked_matches_batch(self):
+        """Chunk boundaries do not change the rolling features"""
+        batch = rolling_features(self.df)
+        chunked = ChunkedRollingFeatures()
+        parts = pd.concat([chunked.transform(self.df.iloc[k:k + 7]) for k in range(0, len(self.df), 7)])
+        np.testing.assert_allclose(parts.to_numpy(), batch.to_numpy(),
+                                   rtol=1e-7, atol=1e-9, equal_nan=True)
+
+    def test_single_reading_window(self):
+        """A window of 1 works in every version: mean is the reading, std and slope are 0"""
+        batch = rolling_features(self.df, windows=(1, 3))
+        stream = StreamingFeatureEngine(windows=(1, 3)).transform(self.df)
+        chunked = ChunkedRollingFeatures(windows=(1, 3))
+        parts = pd.concat([chunked.transform(self.df.iloc[k:k + 7]) for k in range(0, len(self.df), 7)])
+
+        np.testing.assert_allclose(stream.to_numpy(), batch.to_numpy(), rtol=1e-7, atol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(parts.to_numpy(), batch.to_numpy(), rtol=1e-7, atol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(batch["pressure_mean_1"], self.df["pressure"].ffill())
+        self.assertEqual(batch[["pressure_std_1", "pressure_slope_1"]].abs().to_numpy().max(), 0.0)
+
+    def test_invalid_window(self):
+        for make in (feature_names, StreamingFeatureEngine, ChunkedRollingFeatures):
+            with self.assertRaises(ValueError):
+                make(windows=(0, 5))
+
+    def test_leading_nan_yields_nan_features(self):
+        features = rolling_features(self.df)
+        self.assertTrue(features.loc[:2, "temp_mean_5"].isna().all())
+        self.assertFalse(features.loc[3:, "temp_mean_5"].isna().any())
+
+    def test_update_dict_keys(self):
+        engine = StreamingFeatureEngine(windows=(3,), ewma_spans=(4,))
+        out = engine.update_dict({"temp": 48.0, "pressure": 1.01, "vibration": 0.03})
+        self.assertEqual(list(out), feature_names(windows=(3,), ewma_spans=(4,)))
+        self.assertEqual(out["temp_ewma_4"], 48.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.imputation import MISSING_ALERT_COLUMNS, SensorImputer, merge_missing_alerts
+from alert_agent.rules import SENSORS
+
+
+def make_readings(n=500, missing_rate=0.3, seed=3):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-07 01:00", periods=n, freq="1min"),
+        "temp": rng.uniform(45.0, 50.0, n),
+        "pressure": rng.uniform(1.00, 1.05, n),
+        "vibration": rng.uniform(0.02, 0.04, n),
+    })
+    for s in SENSORS:
+        df.loc[rng.random(n) < missing_rate, s] = np.nan
+    return df
+
+
+class TestSensorImputer(unittest.TestCase):
+    """Test suite for the per-sensor imputation policies"""
+
+    def test_ffill_matches_pandas_limit(self):
+        df = make_readings()
+        expected = df[SENSORS].ffill(limit=3)
+        SensorImputer().transform(df)
+        pd.testing.assert_frame_equal(df[SENSORS], expected)
+
+    def test_interpolate_closed_gaps(self):
+        imputer = SensorImputer({"temp": {"method": "interpolate", "max_gap": 2}})
+        values = np.array([1.0, np.nan, 3.0, np.nan, np.nan, 6.0, np.nan, np.nan, np.nan, 10.0, np.nan])
+        unfilled = imputer.impute_column("temp", values)
+
+        np.testing.assert_allclose(values[:6], [1, 2, 3, 4, 5, 6])
+        # a gap longer than max_gap is held for max_gap readings, then left missing
+        np.testing.assert_array_equal(values[6:8], [6.0, 6.0])
+        self.assertTrue(np.isnan(values[8]))
+        # an open gap at the end is held
+        self.assertEqual(values[10], 10.0)
+        self.assertEqual(list(np.flatnonzero(unfilled)), [8])
+
+    def test_hold_last_good_skips_out_of_range_readings(self):
+        imputer = SensorImputer({"temp": {"method": "hold_last_good", "max_gap": None}})
+        values = np.array([47.0, 60.0, np.nan, np.nan])
+        imputer.impute_column("temp", values)
+        np.testing.assert_array_equal(values, [47.0, 60.0, 47.0, 47.0])
+
+    def test_leading_gap_is_not_filled(self):
+        values = np.array([np.nan, np.nan, 1.0])
+        unfilled = SensorImputer().impute_column("temp", values)
+        self.assertEqual(list(unfilled), [True, True, False])
+
+    def test_chunked_matches_batch(self):
+        """Carried state makes chunk boundaries invisible, alerts included"""
+        policies = {
+            "temp": {"method": "interpolate", "max_gap": 4},
+            "pressure": {"method": "hold_last_good", "max_gap": 2},
+            "vibration": {"method": "ffill", "max_gap": 3},
+        }
+        df = make_readings(missing_rate=0.5)
+        batch = df.copy()
+        batch_alerts = SensorImputer(policies).transform(batch)
+
+        imputer = SensorImputer(policies)
+        chunks, alerts = [], []
+        for k in range(0, len(df), 37):
+            chunk = df.iloc[k:k + 37].copy()
+            alerts.append(imputer.transform(chunk))
+            chunks.append(chunk)
+        streamed = pd.concat(chunks)
+
+        # an interpolated gap still open at a chunk end is held instead of waiting
+        held = streamed["temp"] != batch["temp"]
+        pd.testing.assert_frame_equal(streamed[["pressure", "vibration"]], batch[["pressure", "vibration"]])
+        self.assertTrue(streamed["temp"].isna().equals(batch["temp"].isna()))
+        self.assertLess(held.sum(), 0.1 * len(df))
+        pd.testing.assert_frame_equal(merge_missing_alerts(alerts), merge_missing_alerts([batch_alerts]),
+                                      check_dtype=False)
+
+        # hold_last_good before any in-range reading: the newest reading wins, not the previous chunk's
+        policy = {"temp": {"method": "hold_last_good", "max_gap": None}}
+        values = np.array([np.nan, 60.0, 61.0, np.nan])
+        batch = values.copy()
+        SensorImputer(policy).impute_column("temp", batch)
+        imputer = SensorImputer(policy)
+        streamed = [values[k:k + 2].copy() for k in (0, 2)]
+        for part in streamed:
+            imputer.impute_column("temp", part)
+        np.testing.assert_array_equal(np.concatenate(streamed), batch)
+        self.assertEqual(batch[3], 61.0)
+
+    def test_missing_alerts(self):
+        df = make_readings(n=20, missing_rate=0.0)
+        df.loc[5:9, "vibration"] = np.nan
+        alerts = SensorImputer().transform(df)
+
+        self.assertEqual(list(alerts.columns), MISSING_ALERT_COLUMNS)
+        self.assertEqual(len(alerts), 1)
+        row = alerts.iloc[0]
+        self.assertEqual(row["sensor"], "vibration")
+        self.assertEqual(row["n_missing"], 2)
+        self.assertEqual(row["start"], df.loc[8, "timestamp"])
+        self.assertEqual(row["reason"], "Sensor missing (vibration)")
+
+    def test_no_missing_values(self):
+        alerts = SensorImputer().transform(make_readings(n=10, missing_rate=0.0))
+        self.assertTrue(alerts.empty)
+        self.assertEqual(list(alerts.columns), MISSING_ALERT_COLUMNS)
+
+    def test_invalid_policy(self):
+        with self.assertRaises(ValueError):
+            SensorImputer({"temp": {"method": "mean"}})
+        with self.assertRaises(ValueError):
+            SensorImputer({"temp": {"max_gap": -1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
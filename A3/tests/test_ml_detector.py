@@ -0,0 +1,63 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.ml_detector import MLDetector
+
+
+def make_labeled(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "timestamp": pd.date_range("2025-01-07 01:00", periods=n, freq="5min"),
+        "temp": rng.uniform(45, 50, n),
+        "pressure": rng.uniform(1.0, 1.05, n),
+        "vibration": rng.uniform(0.02, 0.04, n),
+    })
+    hot = rng.random(n) < 0.2
+    df.loc[hot, "temp"] = rng.uniform(55, 70, hot.sum())
+    df["label"] = np.where(hot, "abnormal", "normal")
+    return df
+
+
+class TestMLDetector(unittest.TestCase):
+    """Test suite for MLDetector"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.df = make_labeled()
+        cls.detector = MLDetector(n_estimators=20).fit(cls.df.iloc[:100])
+
+    def test_feature_columns(self):
+        features = self.detector.features(self.df)
+        self.assertEqual(list(features.columns), self.detector.feature_names)
+        self.assertIn("temp_slope_20", features.columns)
+
+    def test_predict_matches_classifier(self):
+        features = self.detector.features(self.df)
+        pred, score = self.detector.predict(features)
+        X = self.detector.scaler.transform(features[self.detector.feature_names])
+        np.testing.assert_array_equal(pred, self.detector.clf.predict(X))
+        self.assertTrue(((score >= 0) & (score <= 1)).all())
+
+    def test_detect_flags_hot_rows_with_explanations(self):
+        ml_anomalies = self.detector.detect(self.df)
+        self.assertGreater(len(ml_anomalies), 0)
+        self.assertTrue((ml_anomalies["ml_pred"] == 1).all())
+        self.assertEqual(len(ml_anomalies["ml_explanation"]), len(ml_anomalies))
+        self.assertTrue(ml_anomalies["ml_explanation"].str.contains("temp").any())
+
+    def test_explain_empty(self):
+        self.assertEqual(self.detector.explain(self.detector.features(self.df).iloc[:0]), [])
+
+    def test_fit_requires_label(self):
+        with self.assertRaises(ValueError):
+            MLDetector().fit(self.df.drop(columns=["label"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
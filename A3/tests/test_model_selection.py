@@ -0,0 +1,138 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.data import generate_dummy_data
+from alert_agent.ml_detector import MLDetector
+from alert_agent.model_selection import (
+    SharedArrays, alert_latencies, main, select_cheapest, walk_forward_cv, walk_forward_splits)
+
+GRID = {"n_estimators": [5, 10], "max_depth": [3, None], "threshold": [0.3, 0.5]}
+
+
+class TestWalkForwardSplits(unittest.TestCase):
+
+    def test_expanding_windows(self):
+        self.assertEqual(walk_forward_splits(100, n_splits=3, min_train=40),
+                         [(40, 60), (60, 80), (80, 100)])
+
+    def test_last_fold_takes_the_remainder(self):
+        splits = walk_forward_splits(103, n_splits=4)
+        self.assertEqual(splits[0][0], 20)
+        self.assertEqual(splits[-1][1], 103)
+
+    def test_too_few_rows(self):
+        with self.assertRaises(ValueError):
+            walk_forward_splits(5, n_splits=10)
+
+
+class TestAlertLatencies(unittest.TestCase):
+
+    def test_latency_per_abnormal_run(self):
+        y = np.array([0, 1, 1, 1, 0, 0, 1, 0, 1, 1])
+        alerts = np.array([1, 0, 0, 1, 0, 0, 0, 0, 1, 0], dtype=bool)
+        # run at 1-3 alerted after 2 readings, run at 6 missed, run at 8-9 at once
+        np.testing.assert_array_equal(alert_latencies(y, alerts), [2, -1, 0])
+
+    def test_no_alerts(self):
+        np.testing.assert_array_equal(alert_latencies(np.array([1, 0, 1]), np.zeros(3, bool)), [-1, -1])
+
+
+class TestSharedArrays(unittest.TestCase):
+
+    def test_attach_sees_the_same_data(self):
+        X = np.arange(12, dtype=float).reshape(4, 3)
+        y = np.array([0, 1, 0, 1], dtype=np.int8)
+        with SharedArrays({"X": X, "y": y}) as shared:
+            shm, arrays = SharedArrays.attach(shared.spec)
+            np.testing.assert_array_equal(arrays["X"], X)
+            np.testing.assert_array_equal(arrays["y"], y)
+            self.assertFalse(arrays["X"].flags.writeable)
+            del arrays
+            shm.close()
+
+
+class TestWalkForwardCV(unittest.TestCase):
+    """Test suite for the walk-forward sweep"""
+
+    @classmethod
+    def setUpClass(cls):
+        np.random.seed(0)
+        cls.df = generate_dummy_data(n_rows=400, interval_minutes=5, anomaly_rate=0.2)
+
+    def test_one_row_per_configuration(self):
+        results = walk_forward_cv(self.df, GRID, n_splits=3)
+        self.assertEqual(len(results), 8)
+        self.assertEqual(set(results["max_depth"]), {3, None})
+        for column in ["precision", "recall", "episode_recall", "alert_latency", "predict_us_per_row"]:
+            self.assertIn(column, results)
+        self.assertTrue(results["recall"].between(0, 1).all())
+        # a lower threshold never alerts less
+        by_threshold = results.pivot_table(index=["n_estimators", "max_depth"], columns="threshold",
+                                           values="recall")
+        self.assertTrue((by_threshold[0.3] >= by_threshold[0.5]).all())
+
+    def test_process_pool_matches_serial(self):
+        serial = walk_forward_cv(self.df, GRID, n_splits=3, n_jobs=1)
+        pooled = walk_forward_cv(self.df, GRID, n_splits=3, n_jobs=2)
+        columns = ["n_estimators", "max_depth", "threshold", "precision", "recall", "n_nodes"]
+        pd.testing.assert_frame_equal(serial[columns], pooled[columns])
+
+    def test_rows_with_missing_sensors_are_left_out(self):
+        df = self.df.copy()
+        df.loc[150:169, "pressure"] = np.nan
+        features = MLDetector().features(df)
+        complete = df["pressure"].notna()
+
+        masked = walk_forward_cv(df, GRID, n_splits=3, features=features)
+        dropped = walk_forward_cv(df[complete], GRID, n_splits=3, features=features[complete])
+        columns = ["n_estimators", "max_depth", "threshold", "precision", "recall", "n_nodes"]
+        pd.testing.assert_frame_equal(masked[columns], dropped[columns])
+
+    def test_requires_labels(self):
+        with self.assertRaises(ValueError):
+            walk_forward_cv(self.df.drop(columns=["label"]), GRID)
+
+    def test_select_cheapest(self):
+        results = pd.DataFrame({
+            "n_estimators": [10, 10, 50], "max_depth": [3, 3, None], "threshold": [0.3, 0.5, 0.5],
+            "precision": [0.4, 0.9, 0.95], "recall": [0.91, 0.85, 0.92],
+            "predict_us_per_row": [5.0, 5.0, 30.0], "n_nodes": [100, 100, 900], "fit_s": [0.1, 0.1, 0.5],
+        })
+        self.assertEqual(select_cheapest(results, 0.9)["threshold"], 0.3)
+        self.assertEqual(select_cheapest(results, 0.8)["precision"], 0.9)
+        self.assertEqual(select_cheapest(results, 0.92)["n_estimators"], 50)
+        self.assertIsNone(select_cheapest(results, 0.99))
+
+    @patch("builtins.print")
+    def test_main(self, mock_print):
+        results = main(["--n_rows", "300", "--n_splits", "2", "--n_estimators", "5",
+                        "--max_depth", "3", "none", "--n_jobs", "1", "--recall_target", "0.5"])
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertEqual(len(results), 6)
+        self.assertIn("MLDetector(n_estimators=5", printed)
+
+
+class TestDetectorThreshold(unittest.TestCase):
+
+    def test_threshold_overrides_argmax(self):
+        np.random.seed(1)
+        df = generate_dummy_data(n_rows=200, anomaly_rate=0.2)
+        detector = MLDetector(n_estimators=10).fit(df)
+        pred, score = detector.predict(detector.features(df))
+        detector.threshold = 0.0
+        low, _ = detector.predict(detector.features(df))
+        self.assertTrue((low == 1).all())
+        detector.threshold = 0.5
+        half, _ = detector.predict(detector.features(df))
+        np.testing.assert_array_equal(half, (score >= 0.5).astype(int))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.notifier import AlertDispatcher, FileSink, dispatch_episodes, episode_records
+
+
+class RecordingSink:
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def send(self, batch):
+        if self.fail:
+            raise RuntimeError("sink down")
+        self.batches.append(batch)
+
+
+def make_episodes(n):
+    start = pd.Timestamp("2025-01-07 01:00")
+    return pd.DataFrame({
+        "machine_id": ["machine-1"] * n,
+        "sensor": ["temp"] * n,
+        "start": [start + pd.Timedelta(minutes=i) for i in range(n)],
+        "end": [start + pd.Timedelta(minutes=i) for i in range(n)],
+        "n_alerts": np.ones(n, dtype=int),
+        "peak_rule_score": [np.nan] * n,
+    })
+
+
+class TestEpisodeRecords(unittest.TestCase):
+
+    def test_records_are_json_serialisable(self):
+        records = episode_records(make_episodes(2))
+        self.assertEqual(records[0]["start"], "2025-01-07T01:00:00")
+        self.assertIsNone(records[0]["peak_rule_score"])
+        self.assertIsInstance(records[0]["n_alerts"], int)
+        json.dumps(records)
+
+
+class TestAlertDispatcher(unittest.TestCase):
+
+    def test_batches_respect_batch_size(self):
+        sink = RecordingSink()
+        dispatcher = AlertDispatcher(sink, batch_size=4, max_batches_per_sec=1000)
+
+        sent = asyncio.run(dispatcher.dispatch(make_episodes(10)))
+
+        self.assertEqual(sent, 10)
+        self.assertEqual([len(b) for b in sink.batches], [4, 4, 2])
+
+    def test_rate_limit_spaces_batches(self):
+        sink = RecordingSink()
+        dispatcher = AlertDispatcher(sink, batch_size=1, max_batches_per_sec=20)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            t0 = loop.time()
+            await dispatcher.dispatch(make_episodes(3))
+            return loop.time() - t0
+
+        elapsed = asyncio.run(run())
+        # three sends need at least two gaps of 1/20 s
+        self.assertGreaterEqual(elapsed, 0.09)
+
+    @patch("builtins.print")
+    def test_sink_errors_are_counted(self, mock_print):
+        dispatcher = AlertDispatcher(RecordingSink(fail=True), batch_size=5,
+                                     max_batches_per_sec=1000)
+
+        sent = asyncio.run(dispatcher.dispatch(make_episodes(3)))
+
+        self.assertEqual(sent, 0)
+        self.assertEqual(dispatcher.failed_batches, 1)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AlertDispatcher(RecordingSink(), batch_size=0)
+        with self.assertRaises(ValueError):
+            AlertDispatcher(RecordingSink(), max_batches_per_sec=0)
+
+    def test_file_sink_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "alerts.jsonl")
+
+            sent = dispatch_episodes(make_episodes(3), FileSink(path),
+                                     batch_size=2, max_batches_per_sec=1000)
+
+            with open(path, encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+        self.assertEqual(sent, 3)
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[2]["start"], "2025-01-07T01:02:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import random
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.data import generate_dummy_data, iter_frame_chunks
+from alert_agent.imputation import SensorImputer
+from alert_agent.pipeline import StageTimer, infer_max_gap, run_pipeline
+from alert_agent.rules import detect_rule_anomalies
+
+
+class TestRunPipeline(unittest.TestCase):
+    """Test suite for the chunked detect/explain/merge pipeline"""
+
+    @classmethod
+    def setUpClass(cls):
+        # generate_dummy_data draws from both random modules
+        random.seed(0)
+        np.random.seed(0)
+        cls.df = generate_dummy_data(n_rows=400, interval_minutes=5, introduce_missing=True)
+
+    def test_chunked_equals_single_chunk(self):
+        whole = run_pipeline(iter_frame_chunks(self.df, len(self.df)))
+        for chunksize in (64, 1):
+            chunked = run_pipeline(iter_frame_chunks(self.df, chunksize))
+
+            self.assertEqual(chunked["rows"], 400)
+            pd.testing.assert_frame_equal(whole["merged_alerts"], chunked["merged_alerts"],
+                                          check_dtype=False)
+            pd.testing.assert_frame_equal(whole["episodes"], chunked["episodes"], check_dtype=False)
+
+    def test_training_rows_span_chunks(self):
+        """Chunks smaller than train_rows train the same model as one chunk"""
+        whole = run_pipeline(iter_frame_chunks(self.df, len(self.df)), train_rows=50)
+        small = run_pipeline(iter_frame_chunks(self.df, 20), train_rows=50)
+
+        nodes = [sum(t.tree_.node_count for t in r["detector"].clf.estimators_) for r in (whole, small)]
+        self.assertEqual(nodes[0], nodes[1])
+        pd.testing.assert_frame_equal(whole["ml_anomalies"], small["ml_anomalies"], check_dtype=False)
+        pd.testing.assert_frame_equal(whole["episodes"], small["episodes"], check_dtype=False)
+
+    def test_two_machines_end_to_end(self):
+        """machine_id flows from the readings to the episodes, per-machine state included"""
+        np.random.seed(3)
+        other = generate_dummy_data(n_rows=400, interval_minutes=5, introduce_missing=True)
+        a = self.df.assign(machine_id="press-1")
+        b = other.assign(machine_id="press-2")
+        b.loc[100:109, "temp"] = np.nan
+        # five out-of-range readings in a row on press-2
+        b.loc[200:204, "pressure"] = 1.2
+        # both machines report at the same timestamps, interleaved in one stream
+        both = pd.concat([a, b]).sort_values("timestamp", kind="stable").reset_index(drop=True)
+
+        detector = run_pipeline(iter_frame_chunks(a, 400))["detector"]
+        alone = run_pipeline(iter_frame_chunks(a, 64), detector=detector)
+        mixed = run_pipeline(iter_frame_chunks(both, 64), detector=detector)
+
+        ml_a = mixed["ml_anomalies"][mixed["ml_anomalies"]["machine_id"] == "press-1"]
+        pd.testing.assert_frame_equal(ml_a.reset_index(drop=True), alone["ml_anomalies"],
+                                      check_dtype=False)
+        merged = mixed["merged_alerts"]
+        self.assertFalse(merged.duplicated(["machine_id", "timestamp"]).any())
+        self.assertEqual((merged["machine_id"] == "press-1").sum(), len(alone["merged_alerts"]))
+        self.assertEqual(set(mixed["episodes"]["machine_id"]), {"press-1", "press-2"})
+        # shared timestamps do not shrink the episode gap to 0: the run is one episode
+        run = b.loc[200:204, "timestamp"]
+        pressure = mixed["episodes"].query("machine_id == 'press-2' and sensor == 'pressure'")
+        covering = pressure[(pressure["start"] <= run.min()) & (pressure["end"] >= run.max())]
+        self.assertEqual(len(covering), 1)
+        self.assertGreaterEqual(covering["n_alerts"].iloc[0], 5)
+        # press-1's readings do not fill press-2's gap
+        gap = mixed["missing_alerts"].query("machine_id == 'press-2' and sensor == 'temp'")
+        self.assertEqual(gap["n_missing"].max(), 7)
+
+    def test_rule_alerts_and_episodes(self):
+        result = run_pipeline(iter_frame_chunks(self.df, 100))
+
+        imputed = self.df.copy()
+        SensorImputer().transform(imputed)
+        self.assertEqual(len(result["rule_anomalies"]), len(detect_rule_anomalies(imputed)))
+        self.assertGreaterEqual(result["episodes"]["n_alerts"].sum(), len(result["merged_alerts"]))
+
+    def test_timer_covers_every_stage(self):
+        result = run_pipeline(iter_frame_chunks(self.df, 100))
+        report = result["timer"].report()
+        self.assertEqual(list(report["stage"]),
+                         ["load", "impute", "features", "rules", "ml", "explain", "merge", "episodes"])
+        self.assertEqual(report.set_index("stage").loc["features", "rows"], 400)
+
+    def test_missing_alerts_for_long_gaps(self):
+        df = self.df.copy()
+        df.loc[120:129, "pressure"] = np.nan
+        result = run_pipeline(iter_frame_chunks(df, 64))
+
+        alerts = result["missing_alerts"]
+        long_gap = alerts[alerts["sensor"] == "pressure"].sort_values("n_missing").iloc[-1]
+        # the first 3 readings are forward-filled, the rest of the gap spans two chunks
+        self.assertEqual(long_gap["n_missing"], 7)
+        self.assertEqual(long_gap["start"], df.loc[123, "timestamp"])
+        self.assertEqual(long_gap["end"], df.loc[129, "timestamp"])
+        self.assertFalse(self.df["pressure"].iloc[120:130].isna().all())
+
+    def test_rows_with_missing_sensors_are_not_scored(self):
+        df = self.df.copy()
+        df.loc[120:129, "pressure"] = np.nan
+        # would break the temp threshold if the rows were scored
+        df.loc[120:129, "temp"] = 90.0
+        result = run_pipeline(iter_frame_chunks(df, 64))
+
+        unscored = set(df.loc[123:129, "timestamp"])
+        self.assertEqual(result["unscored_rows"], 7)
+        self.assertFalse(unscored & set(result["rule_anomalies"]["timestamp"]))
+        self.assertFalse(unscored & set(result["ml_anomalies"]["timestamp"]))
+        # the forward-filled start of the gap is still scored
+        self.assertIn(df.loc[120, "timestamp"], set(result["rule_anomalies"]["timestamp"]))
+
+    def test_prefit_detector_is_reused(self):
+        first = run_pipeline(iter_frame_chunks(self.df, 100))
+        again = run_pipeline(iter_frame_chunks(self.df.drop(columns=["label"]), 100),
+                             detector=first["detector"])
+        self.assertIs(again["detector"], first["detector"])
+
+    def test_empty_input(self):
+        result = run_pipeline(iter([]))
+        self.assertEqual(result["rows"], 0)
+        self.assertTrue(result["episodes"].empty)
+
+
+class TestStageTimer(unittest.TestCase):
+
+    def test_accumulates(self):
+        timer = StageTimer()
+        timer.add("rules", 0.5, 100)
+        timer.add("rules", 0.5, 100)
+        report = timer.report().set_index("stage")
+        self.assertEqual(report.loc["rules", "rows"], 200)
+        self.assertAlmostEqual(report.loc["rules", "rows_per_sec"], 200.0)
+
+    @patch("builtins.print")
+    def test_print_report(self, mock_print):
+        timer = StageTimer()
+        timer.add("load", 0.0, 10)
+        timer.print_report()
+        printed = " ".join(str(c.args[0]) for c in mock_print.call_args_list if c.args)
+        self.assertIn("load", printed)
+
+    def test_infer_max_gap(self):
+        ts = pd.date_range("2025-01-07", periods=5, freq="5min")
+        self.assertEqual(infer_max_gap(ts), pd.Timedelta("5min"))
+
+    def test_infer_max_gap_per_machine(self):
+        ts = pd.date_range("2025-01-07", periods=4, freq="5min").repeat(3)
+        machines = ["a", "b", "c"] * 4
+        self.assertEqual(infer_max_gap(ts, machines), pd.Timedelta("5min"))
+        self.assertEqual(infer_max_gap(ts), pd.Timedelta("5min"))
+        self.assertIsNone(infer_max_gap(ts[:3], machines[:3]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import unittest
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.plotting import (
+    AnomalyMarkers, IncrementalMinMax, LiveSensorPlot, anomaly_masks, downsample, lttb_indices,
+    minmax_indices, plot_sensor_anomalies)
+
+
+class TestDownsampling(unittest.TestCase):
+    """Test suite for LTTB and min/max downsampling"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.n = 50_000
+        self.x = np.arange(self.n, dtype=float)
+        self.y = np.sin(self.x / 500) + rng.normal(0, 0.05, self.n)
+
+    def test_lttb_keeps_endpoints_and_size(self):
+        idx = lttb_indices(self.x, self.y, 500)
+        self.assertEqual(len(idx), 500)
+        self.assertEqual(idx[0], 0)
+        self.assertEqual(idx[-1], self.n - 1)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+
+    def test_lttb_small_input_unchanged(self):
+        np.testing.assert_array_equal(lttb_indices(self.x[:10], self.y[:10], 50), np.arange(10))
+
+    def test_minmax_keeps_extremes(self):
+        idx = minmax_indices(self.y, 100)
+        self.assertLessEqual(len(idx), 200)
+        self.assertIn(int(self.y.argmax()), idx)
+        self.assertIn(int(self.y.argmin()), idx)
+
+    def test_downsample_always_keeps_anomalies(self):
+        keep = np.zeros(self.n, dtype=bool)
+        keep[[17, 12_345, 40_001]] = True
+        for method in ("lttb", "minmax"):
+            idx = downsample(self.x, self.y, 300, method=method, keep=keep)
+            self.assertTrue(set([17, 12_345, 40_001]).issubset(idx))
+            self.assertLess(len(idx), 400)
+
+    def test_downsample_skips_nan(self):
+        y = self.y.copy()
+        y[::3] = np.nan
+        idx = downsample(self.x, y, 1000)
+        self.assertFalse(np.isnan(y[idx]).any())
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            downsample(self.x, self.y, 100, method="random")
+
+
+class TestIncrementalMinMax(unittest.TestCase):
+    """Test suite for the live-feed min/max summary"""
+
+    def test_bounded_and_exact_extremes(self):
+        rng = np.random.default_rng(3)
+        y = rng.normal(0, 1, 100_000)
+        x = np.arange(len(y), dtype=float)
+        summary = IncrementalMinMax(max_buckets=64)
+        for lo in range(0, len(y), 3_333):
+            summary.extend(x[lo:lo + 3_333], y[lo:lo + 3_333])
+
+        px, py = summary.points()
+        self.assertLessEqual(len(px), 2 * 65)
+        self.assertEqual(py.max(), y.max())
+        self.assertEqual(py.min(), y.min())
+        self.assertTrue(np.all(np.diff(px) >= 0))
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            IncrementalMinMax(1)
+
+
+class TestAnomalyMarkers(unittest.TestCase):
+    """Test suite for the bounded live-feed anomaly markers"""
+
+    def test_bounded_and_spread_over_time(self):
+        x = np.arange(100_000, dtype=float)
+        markers = AnomalyMarkers(max_markers=50)
+        for lo in range(0, len(x), 777):
+            markers.extend(x[lo:lo + 777], -x[lo:lo + 777])
+
+        offsets = markers.offsets()
+        self.assertLessEqual(len(offsets), 50)
+        self.assertGreater(len(offsets), 25)
+        self.assertTrue(np.all(np.diff(offsets[:, 0]) > 0))
+        np.testing.assert_array_equal(offsets[:, 1], -offsets[:, 0])
+        self.assertEqual(offsets[0, 0], 0.0)
+        self.assertGreater(offsets[-1, 0], 0.9 * len(x))
+
+    def test_keeps_everything_below_the_cap(self):
+        markers = AnomalyMarkers(max_markers=10)
+        markers.extend([1.0, 2.0], [5.0, 6.0])
+        markers.extend([3.0], [7.0])
+        np.testing.assert_array_equal(markers.offsets(), [[1, 5], [2, 6], [3, 7]])
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            AnomalyMarkers(0)
+
+
+class TestSensorPlots(unittest.TestCase):
+    """Test suite for anomaly masks and the plotting helpers"""
+
+    def setUp(self):
+        ts = pd.date_range("2025-01-07 01:00", periods=20, freq="5min")
+        self.df = pd.DataFrame({
+            "timestamp": ts,
+            "temp": 47.0, "pressure": 1.02, "vibration": 0.03,
+        })
+        self.df.loc[3, "temp"] = 60.0
+        self.df.loc[7, "vibration"] = 0.2
+        self.rule = pd.DataFrame({
+            "timestamp": ts[[3, 7]],
+            "alert_reasons": ["Temperature out of range (60.0°C)", "High vibration (0.2)"],
+        })
+        self.ml = pd.DataFrame({
+            "timestamp": ts[[3, 11]],
+            "ml_explanation": ["temp; temp_slope_5", "pressure"],
+        })
+
+    def tearDown(self):
+        plt.close("all")
+
+    def test_anomaly_masks(self):
+        masks = anomaly_masks(self.df, self.rule, self.ml)
+        self.assertEqual(list(np.flatnonzero(masks["temp"][0])), [3])
+        self.assertEqual(list(np.flatnonzero(masks["temp"][1])), [3])
+        self.assertEqual(list(np.flatnonzero(masks["vibration"][0])), [7])
+        self.assertEqual(list(np.flatnonzero(masks["pressure"][1])), [11])
+
+    def test_anomaly_masks_unsorted_input(self):
+        shuffled = self.df.iloc[::-1].reset_index(drop=True)
+        masks = anomaly_masks(shuffled, self.rule, self.ml)
+        self.assertEqual(list(np.flatnonzero(masks["temp"][0])), [16])
+
+    def test_plot_sensor_anomalies_one_figure(self):
+        fig = plot_sensor_anomalies(self.df, self.rule, self.ml, max_points=5)
+        self.assertEqual(len(fig.axes), 3)
+        self.assertEqual(fig.axes[0].get_title(), "Temperature with Anomalies")
+
+    def test_live_plot_updates(self):
+        live = LiveSensorPlot(max_points=8)
+        live.update(self.df.iloc[:10])
+        live.update(self.df.iloc[10:])
+        xs, ys = live.lines["temp"].get_data()
+        self.assertLessEqual(len(xs), 10)
+        self.assertEqual(max(ys), 60.0)
+        self.assertEqual(len(live.scatters["temp"]["rule_only"].get_offsets()), 1)
+
+    def test_live_plot_markers_are_capped(self):
+        live = LiveSensorPlot(max_points=8, max_markers=4)
+        df = pd.concat([self.df] * 10, ignore_index=True)
+        df["timestamp"] = pd.date_range("2025-01-07 01:00", periods=len(df), freq="5min")
+        df["temp"] = 60.0
+        for lo in range(0, len(df), 7):
+            live.update(df.iloc[lo:lo + 7])
+        self.assertLessEqual(len(live.scatters["temp"]["rule_only"].get_offsets()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from alert_agent.rules import anomaly_score, detect_anomalies, detect_rule_anomalies, sensor_excess
+
+
+class TestAnomalyScore(unittest.TestCase):
+    """Test suite for anomaly_score function"""
+
+    def test_normal_reading_scores_zero(self):
+        self.assertEqual(anomaly_score(47.0, 1.02, 0.03), 0.0)
+
+    def test_each_sensor_contribution(self):
+        self.assertEqual(anomaly_score(55.0, 1.02, 0.03), 3.0)
+        self.assertEqual(anomaly_score(40.0, 1.02, 0.03), 3.0)
+        self.assertEqual(anomaly_score(47.0, 1.10, 0.03), 0.2)
+        self.assertEqual(anomaly_score(47.0, 0.95, 0.03), 0.2)
+        self.assertEqual(anomaly_score(47.0, 1.02, 0.08), 1.0)
+
+    def test_sensor_excess_matches_scalar_score(self):
+        temps = np.array([40.0, 47.0, 55.0, np.nan])
+        np.testing.assert_allclose(sensor_excess(temps, "temp"), [3.0, 0.0, 3.0, 0.0])
+
+
+class TestDetectAnomalies(unittest.TestCase):
+    """Test suite for detect_anomalies function"""
+
+    def test_reasons(self):
+        reasons = detect_anomalies({"temp": 60.5, "pressure": 0.9, "vibration": 0.1})
+        self.assertEqual(reasons, [
+            "Temperature out of range (60.5°C)",
+            "Pressure out of range (0.9 bar)",
+            "High vibration (0.1)",
+        ])
+
+    def test_normal_reading(self):
+        self.assertEqual(detect_anomalies({"temp": 47.0, "pressure": 1.0, "vibration": 0.03}), [])
+
+
+class TestDetectRuleAnomalies(unittest.TestCase):
+    """Test suite for the vectorized rule detector"""
+
+    def test_matches_row_by_row_loop(self):
+        rng = np.random.default_rng(0)
+        n = 500
+        df = pd.DataFrame({
+            "timestamp": pd.date_range("2025-01-07", periods=n, freq="1min"),
+            "temp": rng.uniform(38, 58, n).round(1),
+            "pressure": rng.uniform(0.9, 1.15, n).round(3),
+            "vibration": rng.uniform(0.02, 0.09, n).round(3),
+        })
+        df.loc[5, "temp"] = np.nan
+
+        expected = []
+        for _, row in df.iterrows():
+            reasons = detect_anomalies(row)
+            if reasons:
+                expected.append({
+                    "timestamp": row["timestamp"],
+                    "temp": row["temp"],
+                    "pressure": row["pressure"],
+                    "vibration": row["vibration"],
+                    "score": anomaly_score(row["temp"], row["pressure"], row["vibration"]),
+                    "alert_reasons": "; ".join(reasons),
+                })
+        expected = pd.DataFrame(expected)
+
+        result = detect_rule_anomalies(df)
+
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    def test_no_anomalies(self):
+        df = pd.DataFrame({"timestamp": pd.date_range("2025-01-07", periods=3, freq="1min"),
+                           "temp": 47.0, "pressure": 1.02, "vibration": 0.03})
+        result = detect_rule_anomalies(df)
+        self.assertTrue(result.empty)
+        self.assertIn("alert_reasons", result.columns)
+
+
+if __name__ == "__main__":
+    unittest.main()